@@ -0,0 +1,1438 @@
+"""Office Geçmiş ve Sistem Temizleyici - performans ölçümleri
+
+Kullanım:
+    python benchmark.py matcher [--count 1000000]
+    python benchmark.py scheduler [--files 20000] [--workers 4]
+    python benchmark.py tree-delete [--files 100000] [--workers 8]
+    python benchmark.py startup [--runs 10]
+    python benchmark.py fixture DIZIN [--files 2000] [--size 1024] [--depth 3] [--values 500]
+    python benchmark.py cleaners [--files 2000] [--size 1024] [--depth 3] [--values 500] [--output sonuc.json]
+    python benchmark.py profiles [--count 50] [--files 400] [--workers 4]
+    python benchmark.py hives [--count 200] [--values 2000] [--workers 4]
+    python benchmark.py stop [--files 100000] [--runs 3] [--bound 1.0]
+    python benchmark.py rules [--runs 50]
+    python benchmark.py incremental [--files 200000] [--depth 4]
+    python benchmark.py watch [--bursts 5] [--burst-size 200] [--idle 5] [--poll-interval 2]
+    python benchmark.py temp [--files 200000] [--max-age 24] [--quota 20M] [--locked-every 50]
+    python benchmark.py recycle [--volumes 3] [--files 30000] [--depth 3]
+    python benchmark.py recycle-methods [--runs 12] [--fail-seconds 1]
+    python benchmark.py trace [--files 2000] [--values 500] [--runs 5] [--output trace.json]
+    python benchmark.py metrics [--files 2000] [--runs 3] [--writes 200]
+    python benchmark.py log [--records 100000] [--max-size 1M] [--backups 3]
+"""
+import argparse
+import inspect
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import string
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+from temizle import (NULL_TRACER, PROFILE_TASKS, REGF_BIG_DATA_SEGMENT, REG_DWORD, REG_EXPAND_SZ,
+                     REG_MULTI_SZ, REG_QWORD, REG_SZ, RULES_FILE, CachingRegistryBackend, DeletionManifest,
+                     InotifyWatcher, JsonLogWriter, KeywordMatcher, MemoryRegistryBackend, OfficeCleaner,
+                     ParallelTreeDeleter, PollingWatcher, PrometheusTextfile, RecycleMethodCache,
+                     RegfRegistryBackend, RuleCatalog, ScanJournal, TaskScheduler, TraceRecorder, Tracer,
+                     load_rule_catalog, parse_size, regf_name_hash, resource_path)
+
+
+# Kural kataloğundaki Office 365 cloud cache dosya adı anahtar kelimeleri
+CLOUD_FILE_KEYWORDS = load_rule_catalog().file_rule("office365_cloud")["keywords"]
+
+
+def synthetic_names(count, hit_ratio=0.1, seed=1):
+    """Belirli oranda anahtar kelime içeren rastgele dosya adları üret"""
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits
+    extensions = ['.dat', '.bin', '.json', '.DAT', '.xml', '']
+    names = []
+    for _ in range(count):
+        base = ''.join(rng.choices(alphabet, k=rng.randint(6, 20)))
+        if rng.random() < hit_ratio:
+            base += rng.choice(CLOUD_FILE_KEYWORDS).upper()
+        names.append(base + rng.choice(extensions))
+    return names
+
+
+def bench_matcher(count):
+    """Eski any() döngüsü ile derlenmiş KeywordMatcher karşılaştırması"""
+    names = synthetic_names(count)
+
+    start = time.perf_counter()
+    any_hits = sum(1 for name in names
+                   if any(keyword in name.lower() for keyword in CLOUD_FILE_KEYWORDS))
+    any_seconds = time.perf_counter() - start
+
+    matcher = KeywordMatcher({"office365_cloud": CLOUD_FILE_KEYWORDS})
+    start = time.perf_counter()
+    matcher_hits = sum(1 for name in names if matcher.matches(name))
+    matcher_seconds = time.perf_counter() - start
+
+    if any_hits != matcher_hits:
+        raise AssertionError(f"Eşleşme sayıları farklı: any()={any_hits}, matcher={matcher_hits}")
+
+    return {
+        "benchmark": "matcher",
+        "names": count,
+        "hits": matcher_hits,
+        "any_seconds": round(any_seconds, 4),
+        "matcher_seconds": round(matcher_seconds, 4),
+        "speedup": round(any_seconds / matcher_seconds, 2) if matcher_seconds else None,
+    }
+
+
+def build_tree(root, files, files_per_dir=200, size=512):
+    """root altında files adet küçük dosyadan oluşan bir ağaç oluştur"""
+    payload = b"x" * size
+    for index in range(files):
+        directory = os.path.join(root, f"d{index // files_per_dir:05d}")
+        if index % files_per_dir == 0:
+            os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"f{index:07d}.tmp"), "wb") as f:
+            f.write(payload)
+
+
+def bench_scheduler(files, workers):
+    """Tüm seçenekler çalıştırmasının G/Ç benzeri görevlerini sıralı ve eşzamanlı çalıştır"""
+    # temp_files, browser_cache, prefetch, windows_update benzeri birbirinden bağımsız ağaçlar
+    task_names = ["temp_files", "browser_cache", "prefetch", "windows_update"]
+    results = {}
+    for label, max_workers in (("serial", 1), ("parallel", workers)):
+        base = tempfile.mkdtemp(prefix="temizle-bench-")
+        try:
+            tasks = []
+            for name in task_names:
+                root = os.path.join(base, name)
+                build_tree(root, files // len(task_names))
+                tasks.append((name, lambda root=root: shutil.rmtree(root), [("dir", root)]))
+            start = time.perf_counter()
+            TaskScheduler(max_workers).run(tasks)
+            results[f"{label}_seconds"] = round(time.perf_counter() - start, 4)
+        finally:
+            shutil.rmtree(base, ignore_errors=True)
+    results["speedup"] = round(results["serial_seconds"] / results["parallel_seconds"], 2)
+    return {"benchmark": "scheduler", "files": files, "workers": workers, **results}
+
+
+def bench_tree_delete(files, workers):
+    """shutil.rmtree ile ParallelTreeDeleter'ı aynı sentetik ağaç üzerinde karşılaştır"""
+    results = {}
+    deleter = ParallelTreeDeleter(max_workers=workers)
+    for label in ("rmtree", "parallel"):
+        base = tempfile.mkdtemp(prefix="temizle-bench-")
+        try:
+            root = os.path.join(base, "Cache")
+            build_tree(root, files)
+            start = time.perf_counter()
+            if label == "rmtree":
+                shutil.rmtree(root)
+            else:
+                outcome = deleter.delete(root)
+                if outcome["errors"] or os.path.exists(root):
+                    raise AssertionError(f"Ağaç tamamen silinemedi: {outcome}")
+            results[f"{label}_seconds"] = round(time.perf_counter() - start, 4)
+        finally:
+            shutil.rmtree(base, ignore_errors=True)
+    deleter.shutdown()
+    results["speedup"] = round(results["rmtree_seconds"] / results["parallel_seconds"], 2)
+    return {"benchmark": "tree-delete", "files": files, "workers": workers, **results}
+
+
+def bench_startup(runs):
+    """Komut satırı çalıştırmasının başlangıç süresi ve arayüz modüllerinin yüklenmediği kontrolü"""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temizle.py")
+    probe = ("import sys, time; start = time.perf_counter(); sys.path.insert(0, sys.argv[1]); import temizle; "
+             "print(time.perf_counter() - start, 'tkinter' in sys.modules, 'winreg' in sys.modules)")
+    import_seconds, wall_seconds = [], []
+    gui_loaded = registry_loaded = False
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", probe, os.path.dirname(script)],
+                                capture_output=True, text=True, check=True).stdout.split()
+        import_seconds.append(float(output[0]))
+        gui_loaded |= output[1] == "True"
+        registry_loaded |= output[2] == "True"
+
+        start = time.perf_counter()
+        subprocess.run([sys.executable, script, "--list-tasks"], capture_output=True, check=True)
+        wall_seconds.append(time.perf_counter() - start)
+    return {
+        "benchmark": "startup",
+        "runs": runs,
+        "import_seconds_median": round(statistics.median(import_seconds), 4),
+        "cli_wall_seconds_median": round(statistics.median(wall_seconds), 4),
+        "tkinter_imported": gui_loaded,
+        "winreg_imported": registry_loaded,
+    }
+
+
+# Sahte profilde dosyaların dağıtılacağı alanlar:
+# (taban, göreli yol, ağırlık, eşleşen adlar, eşleşmeyen adlar, düz mü)
+# Düz alanlar (Recent, Office config, Logs, Prefetch) temizleyicilerce alt klasörsüz taranır
+PROFILE_AREAS = [
+    ("APPDATA", r"Microsoft\Windows\Recent", 2, ["belge{i}.docx.lnk", "tablo{i}.xlsx.lnk"], [], True),
+    ("APPDATA", r"Microsoft\Word", 1, ["Word{i}.officeUI", "recent{i}.dat"], ["Normal{i}.dotm"], True),
+    ("APPDATA", r"Microsoft\Excel", 1, ["Excel{i}.officeUI", "recent{i}.dat"], ["PERSONAL{i}.xlsb"], True),
+    ("APPDATA", r"Microsoft\Office\16.0\roaming", 1, ["roam{i}.json", "mru{i}.xml"], ["ayar{i}.bin"], False),
+    ("APPDATA", r"Microsoft\Teams\Cache", 1, ["data_{i}", "f_{i}.tmp"], [], False),
+    ("APPDATA", r"Microsoft\SharePoint", 1, ["sharepoint{i}.json"], ["site{i}.bin"], False),
+    ("LOCALAPPDATA", r"Microsoft\Office\16.0\OfficeFileCache", 3, ["cache{i}.fsd", "mru{i}.fsf"], ["blob{i}.dat"], False),
+    ("LOCALAPPDATA", r"Microsoft\Office\16.0\Wef", 1, ["wef{i}.json", "cache{i}.xml"], ["manifest{i}.bin"], False),
+    ("LOCALAPPDATA", r"Microsoft\Office\16.0\WebServiceCache", 1, ["graph{i}.json"], ["svc{i}.bin"], False),
+    ("LOCALAPPDATA", r"Microsoft\Office\Word\Backup", 1, ["recent{i}.wbk"], ["yedek{i}.asd"], False),
+    ("LOCALAPPDATA", r"Microsoft\OneDrive\logs", 1, ["onedrive{i}.log"], ["sync{i}.odl"], False),
+    ("LOCALAPPDATA", r"Microsoft\OneDrive\cache", 1, ["cache{i}.dat"], [], False),
+    ("LOCALAPPDATA", r"Temp", 3, ["tmp{i}.tmp", "setup{i}.log"], ["veri{i}.bin"], False),
+    ("LOCALAPPDATA", r"Google\Chrome\User Data\Default\Cache", 4, ["f_{i:06x}", "data_{i}"], [], False),
+    ("LOCALAPPDATA", r"Microsoft\Edge\User Data\Default\Cache", 3, ["f_{i:06x}", "data_{i}"], [], False),
+    ("APPDATA", r"Mozilla\Firefox\Profiles\abcd1234.default-release\cache2\entries", 2, ["{i:040X}"], [], False),
+    ("WINDIR", r"Temp", 1, ["msi{i}.tmp", "cab_{i}.log"], [], False),
+    ("WINDIR", r"Logs", 1, ["cbs{i}.log"], ["cbs{i}.persist"], True),
+    ("WINDIR", r"Prefetch", 1, ["APP{i}-1A2B3C4D.pf"], ["Layout{i}.ini"], True),
+    ("WINDIR", r"SoftwareDistribution\Download", 3, ["{i:032x}.cab", "{i:032x}.psf"], [], False),
+    ("RECYCLE", r"S-1-5-21-1000", 2, ["$R{i:06X}.docx", "$I{i:06X}.docx"], [], False),
+    ("TEMP", r"", 2, ["_MEI{i}.tmp", "tmp{i}.dat"], [], False),
+]
+
+# Sahte registry: her sürümde uygulama başına MRU anahtarları ve değerlerdeki dosya uzantısı
+REGISTRY_APPS = {
+    "Word": ".docx", "Excel": ".xlsx", "PowerPoint": ".pptx", "Access": ".accdb",
+}
+REGISTRY_KEYS = ["File MRU", "Place MRU", r"User MRU\ADAL_0A1B2C\File MRU", "Recent Files"]
+
+
+def _local_path(relative):
+    return os.path.join(*relative.split("\\")) if relative else ""
+
+
+def write_tree(base, count, size, depth, names, start=0, fanout=4):
+    """base altında count dosyayı depth seviyeli bir ağaca dağıt"""
+    payload = b"x" * size
+    for index in range(count):
+        parts = [base]
+        node = index
+        for level in range(depth):
+            parts.append(f"d{level}_{node % fanout}")
+            node //= fanout
+        directory = os.path.join(*parts)
+        os.makedirs(directory, exist_ok=True)
+        name = names[index % len(names)].format(i=start + index)
+        with open(os.path.join(directory, name), "wb") as f:
+            f.write(payload)
+
+
+def build_profile(root, files=2000, size=1024, depth=3, values=500, seed=1, user="bench"):
+    """root altında sahte APPDATA, LOCALAPPDATA, WINDIR, TEMP, Geri Dönüşüm Kutusu ve registry oluştur"""
+    rng = random.Random(seed)
+    bases = {
+        "APPDATA": os.path.join(root, "Users", user, "AppData", "Roaming"),
+        "LOCALAPPDATA": os.path.join(root, "Users", user, "AppData", "Local"),
+        "WINDIR": os.path.join(root, "Windows"),
+        "TEMP": os.path.join(root, "Users", user, "AppData", "Local", "Temp"),
+        "RECYCLE": os.path.join(root, "$Recycle.Bin"),
+    }
+    total_weight = sum(area[2] for area in PROFILE_AREAS)
+    planted = {"files": 0, "matching": 0}
+    for base_name, relative, weight, matching, other, flat in PROFILE_AREAS:
+        count = max(1, files * weight // total_weight)
+        directory = os.path.join(bases[base_name], _local_path(relative))
+        area_depth = 0 if flat else depth
+        noise = count // 4 if other else 0
+        write_tree(directory, count - noise, rng.randint(size // 2, size * 2), area_depth, matching)
+        if noise:
+            write_tree(directory, noise, size, area_depth, other, start=count)
+        planted["files"] += count
+        planted["matching"] += count - noise
+
+    registry = MemoryRegistryBackend()
+    keys = [(version, app, key) for version in ("14.0", "15.0", "16.0")
+            for app in REGISTRY_APPS for key in REGISTRY_KEYS]
+    per_key = max(1, values // len(keys))
+    for version, app, key in keys:
+        path = rf"Software\Microsoft\Office\{version}\{app}\{key}"
+        registry.set_value(path, "Max Display", 25)
+        for item in range(per_key):
+            registry.set_value(path, f"Item {item + 1}",
+                               f"[F00000000][T01D{item:012X}]*C:\\Belgeler\\dosya{item}{REGISTRY_APPS[app]}")
+    for version in ("15.0", "16.0"):
+        common = rf"Software\Microsoft\Office\{version}\Common"
+        registry.set_value(common + r"\Internet", "sharepoint", "https://contoso.sharepoint.com/sites/ekip")
+        registry.set_value(common + r"\Roaming\Identities\0A1B", "onedrive", "https://onedrive.live.com/")
+        registry.set_value(common + r"\General", "RecentFiles", "C:\\Belgeler\\rapor.docx")
+    registry_file = os.path.join(root, "registry.json")
+    with open(registry_file, "w", encoding="utf-8") as f:
+        json.dump(registry.to_dict(), f, ensure_ascii=False)
+    planted["registry_values"] = per_key * len(keys)
+
+    return {
+        "environ": {"APPDATA": bases["APPDATA"], "LOCALAPPDATA": bases["LOCALAPPDATA"],
+                    "WINDIR": bases["WINDIR"], "TEMP": bases["TEMP"],
+                    "USERPROFILE": os.path.join(root, "Users", user)},
+        "recycle_bin": [bases["RECYCLE"]],
+        "registry": registry_file,
+        "planted": planted,
+    }
+
+
+# regf yazıcısı: fikstür hive'ları (ör. NTUSER.DAT) üretmek için
+_NK = struct.Struct("<2sHQ15IHH")
+_VK = struct.Struct("<2sHIIIHH")
+HIVE_LH_LIMIT = 256
+
+
+def _hive_cell(buffer, payload):
+    """Hücreyi 8 bayta hizalayıp ekle; ilk hbin'e göre konumunu döndür"""
+    size = (len(payload) + 4 + 7) & ~7
+    offset = len(buffer)
+    buffer += struct.pack("<i", -size) + payload + b"\0" * (size - 4 - len(payload))
+    return offset
+
+
+def _hive_name(name):
+    """Ad ve sıkıştırılmış (latin-1) olup olmadığı"""
+    try:
+        return name.encode("latin-1"), True
+    except UnicodeEncodeError:
+        return name.encode("utf-16-le"), False
+
+
+def _hive_value_bytes(data, value_type):
+    if value_type in (REG_SZ, REG_EXPAND_SZ):
+        return (data + "\0").encode("utf-16-le")
+    if value_type == REG_MULTI_SZ:
+        return ("".join(item + "\0" for item in data) + "\0").encode("utf-16-le")
+    if value_type == REG_DWORD:
+        return struct.pack("<I", data & 0xFFFFFFFF)
+    if value_type == REG_QWORD:
+        return struct.pack("<Q", data & 0xFFFFFFFFFFFFFFFF)
+    return bytes(data)
+
+
+def _hive_value(buffer, name, data, value_type, big_data=True):
+    raw = _hive_value_bytes(data, value_type)
+    encoded, compressed = _hive_name(name)
+    if len(raw) <= 4:
+        # Küçük veri, veri konumu alanında saklanır
+        size, data_offset = len(raw) | 0x80000000, int.from_bytes(raw.ljust(4, b"\0"), "little")
+    elif len(raw) > REGF_BIG_DATA_SEGMENT and big_data:
+        segments = [_hive_cell(buffer, raw[i:i + REGF_BIG_DATA_SEGMENT])
+                    for i in range(0, len(raw), REGF_BIG_DATA_SEGMENT)]
+        segment_list = _hive_cell(buffer, struct.pack(f"<{len(segments)}I", *segments))
+        size, data_offset = len(raw), _hive_cell(buffer, struct.pack("<2sHI", b"db", len(segments), segment_list))
+    else:
+        size, data_offset = len(raw), _hive_cell(buffer, raw)
+    return _hive_cell(buffer, _VK.pack(b"vk", len(encoded), size, data_offset, value_type,
+                                        1 if compressed else 0, 0) + encoded)
+
+
+def _hive_list_item(name, offset, signature):
+    """Alt anahtar listesi öğesi: li yalnızca konum, lf adın ilk 4 karakteri, lh ad özeti taşır"""
+    if signature == b"li":
+        return (offset,)
+    if signature == b"lf":
+        return offset, int.from_bytes(name[:4].encode("latin-1", "replace").ljust(4, b"\0"), "little")
+    return offset, regf_name_hash(name)
+
+
+def _hive_subkey_list(buffer, children, signature=b"lh", limit=HIVE_LH_LIMIT):
+    """Büyük harfli ada göre sıralı alt anahtar listesi; limit aşılınca ri altında parçalanır"""
+    children = sorted(children, key=lambda child: child[0].upper())
+    lists = []
+    for start in range(0, len(children), limit):
+        chunk = children[start:start + limit]
+        items = [value for name, offset in chunk for value in _hive_list_item(name, offset, signature)]
+        lists.append(_hive_cell(buffer, struct.pack(f"<2sH{len(items)}I", signature, len(chunk), *items)))
+    if len(lists) == 1:
+        return lists[0]
+    return _hive_cell(buffer, struct.pack(f"<2sH{len(lists)}I", b"ri", len(lists), *lists))
+
+
+def write_hive(filename, registry, root_name="ROOT", list_signature=b"lh", list_limit=HIVE_LH_LIMIT,
+               minor_version=5):
+    """MemoryRegistryBackend içeriğini regf biçiminde bir hive dosyasına yaz
+
+    list_signature alt anahtar listelerinin türünü (lh, lf, li), list_limit ri altında bölünme sınırını
+    belirler; 1.4'ten eski (minor_version < 4) hive'larda büyük veriler tek hücrede saklanır.
+    """
+    tops = {}
+    for path in registry.to_dict():
+        top = path.split("\\")[0]
+        tops.setdefault(top.lower(), top)
+
+    # Önce tüm nk hücreleri ayrılır, listeler hazırlanınca alanları doldurulur
+    buffer = bytearray(b"hbin" + b"\0" * 28)
+    nodes = []
+
+    def allocate(path, name, parent):
+        encoded, compressed = _hive_name(name)
+        offset = _hive_cell(buffer, b"\0" * _NK.size + encoded)
+        snapshot = registry.read_key(path) if path else None
+        index = len(nodes)
+        nodes.append([offset, parent, encoded, compressed, snapshot, []])
+        subkeys = snapshot.subkeys if snapshot is not None else list(tops.values())
+        for subkey in subkeys:
+            child = allocate(f"{path}\\{subkey}" if path else subkey, subkey, offset)
+            nodes[index][5].append((subkey, child))
+        return offset
+
+    root = allocate("", root_name, 0)
+    for offset, parent, encoded, compressed, snapshot, children in nodes:
+        values = snapshot.values if snapshot is not None else []
+        value_offsets = [_hive_value(buffer, *value, big_data=minor_version >= 4) for value in values]
+        value_list = _hive_cell(buffer, struct.pack(f"<{len(values)}I", *value_offsets)) if values else 0xFFFFFFFF
+        subkey_list = (_hive_subkey_list(buffer, children, list_signature, list_limit) if children
+                       else 0xFFFFFFFF)
+        flags = (0x20 if compressed else 0) | (0x0C if offset == root else 0)
+        struct.pack_into(_NK.format, buffer, offset + 4, b"nk", flags, 0, 0, parent,
+                         len(children), 0, subkey_list, 0xFFFFFFFF, len(values), value_list,
+                         0xFFFFFFFF, 0xFFFFFFFF, 0, 0, 0, 0, 0, len(encoded), 0)
+
+    # hbin 4 KB'nin katına tamamlanır; kalan alan boş hücre olarak işaretlenir
+    padding = -len(buffer) % 4096
+    if padding:
+        buffer += struct.pack("<i", padding) + b"\0" * (padding - 4)
+    struct.pack_into("<II", buffer, 4, 0, len(buffer))
+
+    base = bytearray(4096)
+    struct.pack_into("<4sIIQIIIIIII", base, 0, b"regf", 1, 1, 0, 1, minor_version, 0, 1, root, len(buffer), 1)
+    checksum = 0
+    for (word,) in struct.iter_unpack("<I", bytes(base[:0x1FC])):
+        checksum ^= word
+    struct.pack_into("<I", base, 0x1FC, 1 if checksum == 0 else min(checksum, 0xFFFFFFFE))
+    with open(filename, "wb") as f:
+        f.write(base)
+        f.write(buffer)
+
+
+def profile_cleaner(fixture):
+    """Sahte profil üzerinde çalışan, arka plan silmesi kapalı bir temizleyici"""
+    cleaner = OfficeCleaner(environ=fixture["environ"],
+                            registry_backend=MemoryRegistryBackend.from_json(fixture["registry"]))
+    cleaner.recycle_bin_paths = fixture["recycle_bin"]
+    cleaner.background_delete = False
+    cleaner.is_cleaning = True
+    cleaner.registry = CachingRegistryBackend(cleaner.registry_backend)
+    return cleaner
+
+
+def cleaner_methods():
+    """Argümansız çağrılabilen tüm clean_* yöntemleri"""
+    methods = []
+    for name, func in inspect.getmembers(OfficeCleaner, inspect.isfunction):
+        parameters = list(inspect.signature(func).parameters.values())[1:]
+        if name.startswith("clean_") and all(p.default is not p.empty for p in parameters):
+            methods.append(name)
+    return methods
+
+
+def bench_cleaners(files, size, depth, values, memory=True):
+    """Her clean_* yöntemini ayrı sahte profilde çalıştır: dosya/s, değer/s ve bellek tepe değeri"""
+    results = []
+    for name in cleaner_methods():
+        record = {"method": name}
+        for measure_memory in ((False, True) if memory else (False,)):
+            base = tempfile.mkdtemp(prefix="temizle-bench-")
+            try:
+                fixture = build_profile(base, files, size, depth, values)
+                cleaner = profile_cleaner(fixture)
+                run = cleaner.in_task_context(name, getattr(cleaner, name))
+                if measure_memory:
+                    # tracemalloc süreyi uzattığı için bellek ayrı bir çalıştırmada ölçülür
+                    tracemalloc.start()
+                    run()
+                    record["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+                    continue
+                start = time.perf_counter()
+                run()
+                seconds = time.perf_counter() - start
+                totals = cleaner.reclaim.totals()
+                record.update({
+                    "seconds": round(seconds, 4),
+                    "files": totals["files"],
+                    "dirs": totals["dirs"],
+                    "bytes": totals["bytes"],
+                    "registry_values": totals["registry_values"],
+                    "registry_keys": totals["registry_keys"],
+                    "files_per_second": round(totals["files"] / seconds, 1) if seconds else None,
+                    "values_per_second": round(totals["registry_values"] / seconds, 1) if seconds else None,
+                    "planted": fixture["planted"],
+                })
+            finally:
+                shutil.rmtree(base, ignore_errors=True)
+        results.append(record)
+    return {
+        "benchmark": "cleaners",
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {"files": files, "size": size, "depth": depth, "values": values},
+        "results": results,
+    }
+
+
+def _registry_entries(manifest):
+    return sorted((entry["kind"], entry["path"].lower(), entry.get("name", "").lower())
+                  for entry in manifest.entries if entry["kind"].startswith("registry"))
+
+
+def bench_hives(count, values, workers):
+    """NTUSER.DAT fikstürlerini çevrimdışı tara: canlı taramayla aynı manifest mi, hive başına süre"""
+    base = tempfile.mkdtemp(prefix="temizle-hives-")
+    try:
+        fixture = build_profile(base, files=50, size=64, depth=1, values=values, user="user000")
+        registry = MemoryRegistryBackend.from_json(fixture["registry"])
+        users = os.path.join(base, "Users")
+        for index in range(count):
+            profile = os.path.join(users, f"user{index:03d}")
+            os.makedirs(os.path.join(profile, "AppData"), exist_ok=True)
+            write_hive(os.path.join(profile, "NTUSER.DAT"), registry)
+
+        # Aynı içerik canlı (bellek içi) ve hive arka ucuyla taranınca aynı registry öğeleri bulunmalı
+        manifests = []
+        for backend in (MemoryRegistryBackend.from_json(fixture["registry"]),
+                        RegfRegistryBackend(os.path.join(users, "user000", "NTUSER.DAT"))):
+            cleaner = OfficeCleaner(environ=fixture["environ"], registry_backend=backend)
+            cleaner.run_cleaning(["office_history"], dry_run=True)
+            manifests.append(_registry_entries(cleaner.manifest))
+        if manifests[0] != manifests[1] or not manifests[0]:
+            raise AssertionError(f"Hive taraması canlı taramadan farklı: {len(manifests[0])} / {len(manifests[1])} öğe")
+
+        cleaner = OfficeCleaner(environ={}, registry_backend=MemoryRegistryBackend())
+        outcome = cleaner.run_profile_sweep(users, ("office_history",), profile_workers=workers,
+                                            dry_run=True, offline_registry=True)
+        found = sum(result["tasks"]["office_history"]["registry_values"] + result["tasks"]["office_history"]["registry_keys"]
+                    for result in outcome["profiles"].values())
+        if found != len(manifests[0]) * count:
+            raise AssertionError(f"Profil taramasında eksik registry öğesi: {found}")
+        return {
+            "benchmark": "hives",
+            "hives": count,
+            "registry_values": values,
+            "workers": workers,
+            "hive_bytes": os.path.getsize(os.path.join(users, "user000", "NTUSER.DAT")),
+            "matches_live_scan": True,
+            "entries_per_hive": len(manifests[0]),
+            "sweep_seconds": outcome["duration_seconds"],
+            "per_hive_ms": round(outcome["duration_seconds"] * 1000 / count, 2),
+        }
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+def bench_profiles(count, files, workers):
+    """Çok profilli (terminal sunucusu) taramayı tek ve çok işçili havuzla ölç"""
+    results = {}
+    for label, profile_workers in (("sequential", 1), ("pool", workers)):
+        base = tempfile.mkdtemp(prefix="temizle-profiles-")
+        try:
+            for index in range(count):
+                build_profile(base, files=files, size=256, depth=2, values=0, seed=index, user=f"user{index:03d}")
+            # Sistem profilleri atlanmalı
+            for name in ("Public", "Default"):
+                os.makedirs(os.path.join(base, "Users", name, "AppData", "Local", "Temp"), exist_ok=True)
+                with open(os.path.join(base, "Users", name, "AppData", "Local", "Temp", "dokunma.tmp"), "wb"):
+                    pass
+            cleaner = OfficeCleaner(environ={}, registry_backend=MemoryRegistryBackend())
+            outcome = cleaner.run_profile_sweep(os.path.join(base, "Users"), profile_workers=profile_workers)
+            cleaner.reaper.wait()
+            untouched = all(os.path.exists(os.path.join(base, "Users", name, "AppData", "Local", "Temp", "dokunma.tmp"))
+                            for name in ("Public", "Default"))
+            if outcome["profiles_found"] != count or not untouched:
+                raise AssertionError(f"Profil keşfi hatalı: {outcome['profiles_found']} profil, sistem profilleri korunmuş: {untouched}")
+            results[f"{label}_seconds"] = outcome["duration_seconds"]
+            results[f"{label}_files"] = outcome["total"]["files"]
+        finally:
+            shutil.rmtree(base, ignore_errors=True)
+    results["speedup"] = round(results["sequential_seconds"] / results["pool_seconds"], 2)
+    return {"benchmark": "profiles", "profiles": count, "files_per_profile": files, "workers": workers, **results}
+
+
+STOP_TASKS = ("temp_files", "browser_cache", "recycle_bin", "windows_update", "office_history")
+
+
+def bench_stop(files, runs, bound):
+    """Büyük sahte profilde temizliği farklı anlarda durdur; durdurmanın bitmesine kadar geçen süreyi ölç"""
+    trials = []
+    for run in range(runs):
+        delay = 0.05 * (run + 1) ** 2
+        base = tempfile.mkdtemp(prefix="temizle-stop-")
+        try:
+            fixture = build_profile(base, files=files, size=64, depth=4, values=5000, seed=run + 1)
+            cleaner = OfficeCleaner(environ=fixture["environ"],
+                                    registry_backend=MemoryRegistryBackend.from_json(fixture["registry"]))
+            cleaner.recycle_bin_paths = fixture["recycle_bin"]
+            cleaner.background_delete = False
+            outcome = {}
+            worker = threading.Thread(target=lambda: outcome.update(cleaner.run_cleaning(list(STOP_TASKS))))
+            worker.start()
+            time.sleep(delay)
+            stopped = time.perf_counter()
+            cleaner.cancel()
+            worker.join()
+            latency = time.perf_counter() - stopped
+            cleaner.reaper.stop()
+            trials.append({
+                "stop_after_seconds": delay,
+                "latency_seconds": round(latency, 4),
+                "cancelled": outcome.get("cancelled"),
+                "files_deleted": outcome.get("total", {}).get("files"),
+            })
+        finally:
+            shutil.rmtree(base, ignore_errors=True)
+
+    # Uzun süren bir alt süreç de (ör. PowerShell) iptalde hemen sonlandırılmalı
+    cleaner = OfficeCleaner(environ={}, registry_backend=MemoryRegistryBackend())
+    cleaner.is_cleaning = True
+    threading.Timer(0.2, cleaner.cancel).start()
+    started = time.perf_counter()
+    try:
+        cleaner.run_command([sys.executable, "-c", "import time; time.sleep(30)"], timeout=30)
+    except subprocess.SubprocessError:
+        pass
+    command_latency = time.perf_counter() - started - 0.2
+
+    worst = max([trial["latency_seconds"] for trial in trials] + [command_latency])
+    return {
+        "benchmark": "stop",
+        "files": files,
+        "bound_seconds": bound,
+        "trials": trials,
+        "command_latency_seconds": round(command_latency, 4),
+        "worst_latency_seconds": round(worst, 4),
+        "within_bound": worst <= bound,
+    }
+
+
+def bench_rules(runs):
+    """Kural kataloğunun doğrulanıp derlenmesi ile özet anahtarlı önbellekten yüklenmesi"""
+    filename = resource_path(RULES_FILE)
+    cache_dir = tempfile.mkdtemp(prefix="temizle-rules-")
+    try:
+        compile_times, cached_times = [], []
+        for _ in range(runs):
+            for name in os.listdir(cache_dir):
+                os.remove(os.path.join(cache_dir, name))
+            start = time.perf_counter()
+            compiled = RuleCatalog.load(filename, cache_dir=cache_dir)
+            compile_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            cached = RuleCatalog.load(filename, cache_dir=cache_dir)
+            cached_times.append(time.perf_counter() - start)
+        if cached.prefix_index != compiled.prefix_index or cached.registry_rules != compiled.registry_rules:
+            raise AssertionError("Önbellekten yüklenen katalog derlenenden farklı")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    # Derlenmiş eşleştiricilerin kural başına bir kez kurulduğunu da ölç
+    start = time.perf_counter()
+    for rule in compiled.registry_rules:
+        compiled.value_filter(rule["name"])
+    filters_seconds = time.perf_counter() - start
+
+    compile_median = statistics.median(compile_times)
+    cached_median = statistics.median(cached_times)
+    return {
+        "benchmark": "rules",
+        "runs": runs,
+        "file_rules": len(compiled.file_rules),
+        "registry_rules": len(compiled.registry_rules),
+        "roots": len(compiled.prefix_index),
+        "compile_median_seconds": round(compile_median, 6),
+        "cached_median_seconds": round(cached_median, 6),
+        "value_filters_seconds": round(filters_seconds, 6),
+        "speedup": round(compile_median / cached_median, 2) if cached_median else None,
+    }
+
+
+def _age_directories(root, seconds):
+    """root altındaki tüm dizinlerin mtime'ını geriye al (aradan zaman geçmiş gibi)"""
+    past = time.time() - seconds
+    for directory, _, _ in os.walk(root):
+        os.utime(directory, (past, past))
+
+
+def bench_incremental(files, depth):
+    """Günlüksüz tam tarama ile değişmemiş ağaçta artımlı yeniden tarama; ardından doğruluk denetimleri"""
+    base = tempfile.mkdtemp(prefix="temizle-incremental-")
+    journal_file = os.path.join(base, "gunluk.json")
+    try:
+        fixture = build_profile(base, files=files, size=64, depth=depth, values=10)
+
+        def scan(journal):
+            cleaner = profile_cleaner(fixture)
+            cleaner.journal = journal
+            start = time.perf_counter()
+            planner = cleaner.run_scan_rules(cleaner.scan_rules())
+            return time.perf_counter() - start, planner
+
+        def load():
+            return ScanJournal.load(journal_file, key=load_rule_catalog().digest)
+
+        # İlk çalıştırma eşleşen dosyaları siler (dizinlerin mtime'ı değişir); bir saat geçmiş sayılır.
+        # İkinci çalıştırma değişen dizinleri yeniden okuyup temiz olarak yazar: kararlı durum budur.
+        journal = load()
+        first_seconds, first = scan(journal)
+        journal.save()
+        _age_directories(base, 3600)
+        journal = load()
+        scan(journal)
+        journal.save()
+
+        full_seconds, full = scan(None)
+        journal = load()
+        incremental_seconds, incremental = scan(journal)
+        journal.save()
+
+        # Denetim 1: atlanan bir alt ağacın derininde yeni eşleşen dosya bulunmalı
+        deep = os.path.join(fixture["environ"]["LOCALAPPDATA"], "Microsoft", "Office", "16.0", "Wef",
+                            *[f"d{level}_0" for level in range(depth)])
+        planted = os.path.join(deep, "recent_yeni.json")
+        with open(planted, "wb") as f:
+            f.write(b"x")
+        journal = load()
+        scan(journal)
+        journal.save()
+        new_file_found = not os.path.exists(planted)
+
+        # Denetim 2: az önce değişen (mtime'ı yeni) dizine güvenilmez, hemen ardından yine okunur
+        _, after_change = scan(load())
+        racy_rescanned = after_change.dir_reads > 0 and after_change.skipped_dirs > 0
+
+        # Denetim 3: önizlemede kalan dosyalar dizini temiz saymaz
+        with open(planted, "wb") as f:
+            f.write(b"x")
+        _age_directories(base, 3600)
+        preview = profile_cleaner(fixture)
+        preview.dry_run = True
+        preview.manifest = DeletionManifest()
+        preview.journal = load()
+        preview.run_scan_rules(preview.scan_rules())
+        preview.journal.save()
+        _, after_preview = scan(load())
+        preview_not_trusted = not os.path.exists(planted)
+
+        # Denetim 4: farklı kural kataloğu anahtarıyla günlük geçersiz olur
+        invalidated = ScanJournal.load(journal_file, key="baska-katalog")
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+    return {
+        "benchmark": "incremental",
+        "files": files,
+        "depth": depth,
+        "first_run_seconds": round(first_seconds, 4),
+        "first_run_files_cleaned": sum(rule.cleaned for rule in first.rules),
+        "full_scan_seconds": round(full_seconds, 4),
+        "full_scan_dir_reads": full.dir_reads,
+        "incremental_seconds": round(incremental_seconds, 4),
+        "incremental_dir_reads": incremental.dir_reads,
+        "incremental_skipped_dirs": incremental.skipped_dirs,
+        "speedup": round(full_seconds / incremental_seconds, 2) if incremental_seconds else None,
+        "checks": {
+            "new_file_in_skipped_subtree_found": new_file_found,
+            "changed_directory_rescanned": bool(racy_rescanned),
+            "preview_leaves_directory_untrusted": preview_not_trusted and after_preview.dir_reads > 0,
+            "catalog_change_invalidates": invalidated.invalidated and not invalidated.sections,
+        },
+    }
+
+
+def _thread_activity(native_id):
+    """İş parçacığının (bağlam değişimi sayısı, CPU saniyesi); /proc yoksa None"""
+    task = f"/proc/self/task/{native_id}"
+    try:
+        with open(f"{task}/status", encoding="ascii") as f:
+            switches = sum(int(line.split()[1]) for line in f if "ctxt_switches" in line)
+        with open(f"{task}/stat", encoding="ascii") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    return switches, (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def bench_watch(bursts, burst_size, idle, poll_interval):
+    """İzleme modu: boşta uyanma/CPU ve patlama halinde oluşan dosyaların silinme gecikmesi"""
+    results = []
+    backends = [("poll", lambda: PollingWatcher(poll_interval))]
+    if sys.platform.startswith("linux"):
+        backends.insert(0, ("inotify", InotifyWatcher))
+    for name, make_watcher in backends:
+        base = tempfile.mkdtemp(prefix="temizle-watch-")
+        try:
+            fixture = build_profile(base, files=2000, size=64, depth=3, values=10)
+            cleaner = OfficeCleaner(environ=fixture["environ"], registry_backend=MemoryRegistryBackend())
+            cleaner.background_delete = False
+            watching = threading.Event()
+            cleaner.log_handler = lambda message, level: "izleniyor" in message and watching.set()
+            outcome = {}
+            worker = threading.Thread(target=lambda: outcome.update(
+                cleaner.run_watch(make_watcher(), debounce=0.1, max_delay=1.0)))
+            worker.start()
+            watching.wait()
+
+            before = _thread_activity(worker.native_id)
+            time.sleep(idle)
+            after = _thread_activity(worker.native_id)
+
+            wef = os.path.join(fixture["environ"]["LOCALAPPDATA"], "Microsoft", "Office", "16.0", "Wef")
+            latencies = []
+            for burst in range(bursts):
+                # Her patlamada yeni bir alt dizin de oluşur: izleme kurulmadan önce yazılan dosyalar kaçmamalı
+                targets = [os.path.join(wef, f"d0_{index % 4}", "d1_0") for index in range(burst_size // 2)]
+                targets += [os.path.join(wef, f"yeni{burst}", "alt")] * (burst_size - len(targets))
+                created = time.perf_counter()
+                planted = []
+                for index, directory in enumerate(targets):
+                    os.makedirs(directory, exist_ok=True)
+                    path = os.path.join(directory, f"recent_{burst}_{index}.json")
+                    with open(path, "wb") as f:
+                        f.write(b"{}")
+                    planted.append(path)
+                deadline = created + 10 * poll_interval + 5
+                while any(os.path.exists(path) for path in planted) and time.perf_counter() < deadline:
+                    time.sleep(0.005)
+                latencies.append(time.perf_counter() - created)
+                if any(os.path.exists(path) for path in planted):
+                    raise AssertionError(f"{name}: oluşturulan dosyalar temizlenmedi")
+
+            cleaner.cancel()
+            worker.join()
+            results.append({
+                "watcher": outcome.get("watch"),
+                "idle_seconds": idle,
+                "idle_wakeups": after[0] - before[0] if before and after else None,
+                "idle_cpu_seconds": round(after[1] - before[1], 4) if before and after else None,
+                "burst_size": burst_size,
+                "burst_latency_median_seconds": round(statistics.median(latencies), 4),
+                "burst_latency_max_seconds": round(max(latencies), 4),
+                "batches": outcome.get("batches"),
+                "events": outcome.get("events"),
+                "files_cleaned": outcome.get("total", {}).get("files"),
+            })
+        finally:
+            shutil.rmtree(base, ignore_errors=True)
+    return {"benchmark": "watch", "bursts": bursts, "poll_interval_seconds": poll_interval, "backends": results}
+
+
+class _LockingCleaner(OfficeCleaner):
+    """Bazı dosyaları kullanımdaymış gibi silemeyen temizleyici (Linux'ta paylaşım ihlali yoktur)"""
+
+    def __init__(self, locked, **kwargs):
+        super().__init__(**kwargs)
+        self.locked = locked
+        self.attempts = {}
+
+    def remove_file(self, path, entry=None, dry_run=None):
+        if path in self.locked:
+            self.attempts[path] = self.attempts.get(path, 0) + 1
+            raise PermissionError(13, "dosya başka bir işlem tarafından kullanılıyor", path)
+        return super().remove_file(path, entry, dry_run)
+
+
+def bench_temp(files, max_age, quota, locked_every):
+    """Yaş ve kota politikalı temp temizliği: süre, bellek tepe noktası ve seçim doğruluğu"""
+    rng = random.Random(7)
+    base = tempfile.mkdtemp(prefix="temizle-temp-")
+    temp_dir = os.path.join(base, "Temp")
+    try:
+        now = time.time()
+        planted = {}
+        for index in range(files):
+            directory = os.path.join(temp_dir, f"kurulum{index % 50}") if index % 3 else temp_dir
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"tmp{index}.tmp")
+            size = rng.randint(64, 4096)
+            with open(path, "wb") as f:
+                f.write(b"x" * size)
+            # Yaşlar 1-96 saat; ilk yüz dosya son bir saatte oluşmuş (kota da bunlara dokunmamalı)
+            stamp = now - (rng.uniform(0, 3000) if index < 100 else rng.uniform(3600, 96 * 3600))
+            os.utime(path, (stamp, stamp))
+            planted[path] = (stamp, size)
+        locked = {path for index, path in enumerate(planted) if locked_every and index % locked_every == 0}
+
+        # Karşılaştırma: tüm dosyaları belleğe alıp sıralayan yöntemin bellek tepe noktası
+        tracemalloc.start()
+        everything = []
+        for directory, _, names in os.walk(temp_dir):
+            for name in names:
+                path = os.path.join(directory, name)
+                stat = os.stat(path)
+                everything.append((stat.st_mtime, stat.st_size, path))
+        everything.sort()
+        naive_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del everything
+
+        # Isınma: ilk çalıştırmanın modül yüklemeleri politika belleğine sayılmasın
+        empty_dir = os.path.join(base, "Bos")
+        os.makedirs(empty_dir)
+        warmup = OfficeCleaner(environ={"TEMP": empty_dir})
+        warmup.temp_max_age_hours = max_age
+        warmup.temp_quota_bytes = quota
+        warmup.run_cleaning(["temp_files"])
+
+        cleaner = _LockingCleaner(locked, environ={"TEMP": temp_dir})
+        cleaner.background_delete = False
+        cleaner.temp_max_age_hours = max_age
+        cleaner.temp_quota_bytes = quota
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = cleaner.run_cleaning(["temp_files"])
+        seconds = time.perf_counter() - start
+        policy_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        remaining = {}
+        for directory, _, names in os.walk(temp_dir):
+            for name in names:
+                path = os.path.join(directory, name)
+                remaining[path] = planted[path]
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+    deleted = [planted[path][0] for path in planted if path not in remaining]
+    # Kotanın silebileceği ama bıraktığı dosyalar: kilitsiz ve bir saatten eski
+    candidates = [stamp for path, (stamp, _) in remaining.items() if path not in locked and stamp < now - 3600]
+    remaining_size = sum(size for _, size in remaining.values())
+    locked_size = sum(planted[path][1] for path in locked if path in remaining)
+    task = result["tasks"]["temp_files"]
+    return {
+        "benchmark": "temp",
+        "files": files,
+        "max_age_hours": max_age,
+        "quota_bytes": quota,
+        "seconds": round(seconds, 4),
+        "deleted": task["files"],
+        "kept": task["kept"],
+        "locked": task["locked"],
+        "remaining_bytes": remaining_size,
+        "policy_peak_bytes": policy_peak,
+        "full_sort_peak_bytes": naive_peak,
+        "checks": {
+            "age_only_deletes_old_files": quota is not None or all(stamp < now - max_age * 3600 for stamp in deleted),
+            "under_quota": quota is None or remaining_size - locked_size <= quota or not candidates,
+            "oldest_deleted_first": not deleted or not candidates or max(deleted) <= min(candidates),
+            "recent_files_kept": all(path in remaining for path in list(planted)[:100]),
+            # Tek turluk yığına sığan klasör bilerek tümüyle seçilebilir; büyük klasörde bellek sınırlı kalmalı
+            "peak_below_full_sort": files <= OfficeCleaner.TEMP_QUOTA_BATCH or policy_peak < naive_peak,
+            "locked_tried_once": bool(cleaner.attempts) == bool(locked)
+            and all(count == 1 for count in cleaner.attempts.values()),
+        },
+    }
+
+
+def build_recycle_bins(root, volumes, files, depth, seed=3):
+    """Birim başına $Recycle.Bin/<SID>/$R... ağaçları oluştur; {kök: (dosya, klasör, bayt)} döndür"""
+    rng = random.Random(seed)
+    bins = {}
+    for volume in range(volumes):
+        recycle = os.path.join(root, f"vol{volume}", "$Recycle.Bin")
+        counts = [0, 0, 0]
+        for index in range(files):
+            sid = f"S-1-5-21-{index % 3}"
+            parts = [sid] + [f"$R{rng.randrange(40):02d}" for _ in range(rng.randrange(depth + 1))]
+            directory = os.path.join(recycle, *parts)
+            os.makedirs(directory, exist_ok=True)
+            size = rng.randint(16, 2048)
+            with open(os.path.join(directory, f"$I{index}.dat"), "wb") as f:
+                f.write(b"r" * size)
+            counts[0] += 1
+            counts[2] += size
+        counts[1] = sum(len(dirs) for _, dirs, _ in os.walk(recycle))
+        bins[recycle] = tuple(counts)
+    return bins
+
+
+def _recycle_top_down(cleaner, roots):
+    """Eski Python yöntemi: yukarıdan aşağı os.walk, her alt klasör için os.listdir ile boşluk tahmini"""
+    cleaned_items = 0
+    for recycle_path in roots:
+        for root, dirs, files in os.walk(recycle_path):
+            for file in files:
+                try:
+                    cleaner.remove_file(os.path.join(root, file))
+                    cleaned_items += 1
+                except OSError:
+                    continue
+            for dir_name in dirs:
+                try:
+                    dir_path = os.path.join(root, dir_name)
+                    if not os.listdir(dir_path):
+                        cleaner.remove_dir(dir_path)
+                        cleaned_items += 1
+                except OSError:
+                    continue
+    return cleaned_items
+
+
+def bench_recycle(volumes, files, depth):
+    """Geri dönüşüm kutusu Python yöntemi: eski yukarıdan aşağı geçiş ile birim başına paralel alttan üste geçiş
+
+    Birim başına sayılar ve silinemeyen öğelerin sayımı tests/test_recycle_bin.py'de denetlenir.
+    """
+    results = {}
+    for variant in ("top_down", "bottom_up"):
+        base = tempfile.mkdtemp(prefix="temizle-recycle-")
+        try:
+            bins = build_recycle_bins(base, volumes, files, depth)
+            cleaner = OfficeCleaner(environ={})
+            cleaner.recycle_bin_paths = list(bins)
+            cleaner.background_delete = False
+            start = time.perf_counter()
+            if variant == "top_down":
+                cleaner.is_cleaning = True
+                cleaner._task_context.name = "recycle_bin"
+                # Eski geçiş her çalıştırmada yalnızca bir düzey boş klasör siler; kutu boşalana dek tekrarlanır
+                items, passes = 0, 0
+                while True:
+                    removed = _recycle_top_down(cleaner, list(bins))
+                    passes += 1
+                    items += removed
+                    if not removed:
+                        break
+                per_volume = {"passes": passes}
+            else:
+                result = cleaner.run_cleaning(["recycle_bin"])
+                per_volume = result["tasks"]["recycle_bin"]["volumes"]
+                items = sum(volume["files"] + volume["dirs"] for volume in per_volume.values())
+            seconds = time.perf_counter() - start
+            results[variant] = {"seconds": round(seconds, 4), "items": items, "volumes": per_volume}
+        finally:
+            shutil.rmtree(base, ignore_errors=True)
+
+    results["top_down"]["passes"] = results["top_down"].pop("volumes")["passes"]
+    return {
+        "benchmark": "recycle",
+        "volumes": volumes,
+        "files_per_volume": files,
+        "cpu_count": os.cpu_count(),
+        "top_down": results["top_down"],
+        "bottom_up": results["bottom_up"],
+        "speedup": round(results["top_down"]["seconds"] / max(results["bottom_up"]["seconds"], 1e-9), 2),
+    }
+
+
+class _FakeVolumeCleaner(_LockingCleaner):
+    """Sistem geri dönüşüm kutusu yerine sahte birimleri boşaltan temizleyici"""
+
+    def __init__(self, roots, locked, **kwargs):
+        super().__init__(locked, **kwargs)
+        self.roots = roots
+
+    def recycle_bin_roots(self):
+        return self.roots
+
+
+def bench_recycle_methods(runs, fail_seconds):
+    """Yöntem önbelleği: PowerShell'in yavaşça başarısız olduğu makinede ardışık çalıştırmaların süresi
+
+    Sıralama ve yeniden sınama kuralları tests/test_recycle_methods.py'de denetlenir.
+    """
+    base = tempfile.mkdtemp(prefix="temizle-methods-")
+    now = [time.time()]
+    fail = [sys.executable, "-c", f"import sys, time; time.sleep({fail_seconds}); sys.exit(1)"]
+
+    def run_once(cache_name, commands):
+        bins = build_recycle_bins(os.path.join(base, "bins"), 2, 200, 2)
+        # Her birimde bir dosya kullanımda: Python geçişi tamamlanamaz, komutlara sıra gelir
+        locked = {os.path.join(recycle, "S-1-5-21-0", "$I0.dat") for recycle in bins}
+        locked = {path for path in locked if os.path.exists(path)}
+        stubs = {"powershell": fail,
+                 "cmd": [sys.executable, "-c", f"import shutil; shutil.rmtree({os.path.join(base, 'bins')!r})"]}
+        cleaner = _FakeVolumeCleaner(list(bins), locked, environ={})
+        cleaner.background_delete = False
+        cleaner.recycle_commands = {name: stubs[name] if commands[name] else list(fail) for name in commands}
+        calls = []
+
+        def executor(args, timeout):
+            calls.append(next(name for name, value in cleaner.recycle_commands.items() if value is args))
+            cleaner.run_command(args, timeout)
+        cleaner.command_executor = executor
+        cache = RecycleMethodCache.load(os.path.join(base, cache_name), host="bench")
+        cache.clock = lambda: now[0]
+        cleaner.recycle_method_cache = cache
+        start = time.perf_counter()
+        result = cleaner.run_cleaning(["recycle_bin"])
+        seconds = time.perf_counter() - start
+        shutil.rmtree(os.path.join(base, "bins"), ignore_errors=True)
+        return {"seconds": round(seconds, 3), "commands": calls,
+                "method": result["tasks"]["recycle_bin"].get("method")}
+
+    try:
+        working = {"powershell": False, "cmd": True}
+        # Önbelleksiz: her çalıştırma boş bir önbellekle başlar
+        uncached = [run_once(f"bos-{index}.json", working) for index in range(3)]
+        cached = [run_once(RecycleMethodCache.FILE_NAME, working) for _ in range(runs)]
+        # Bir hafta sonra CMD de çalışmaz olursa PowerShell yeniden sınanmalı
+        now[0] += RecycleMethodCache.RETEST_SECONDS + 1
+        changed = run_once(RecycleMethodCache.FILE_NAME, {"powershell": False, "cmd": False})
+        with open(os.path.join(base, RecycleMethodCache.FILE_NAME), "r", encoding="utf-8") as f:
+            stored = json.load(f)
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+    return {
+        "benchmark": "recycle-methods",
+        "runs": runs,
+        "fail_seconds": fail_seconds,
+        "uncached_seconds": [run["seconds"] for run in uncached],
+        "cached_seconds": [run["seconds"] for run in cached],
+        "cached_commands": [run["commands"] for run in cached],
+        "after_expiry": changed,
+        "cache": stored["methods"],
+    }
+
+
+class _CountingTracer(Tracer):
+    """Kapalı ölçümün bir çalıştırmada kaç kez çağrıldığını sayan boş ölçüm"""
+
+    def __init__(self):
+        self.spans = 0
+        self.counts = 0
+
+    def span(self, name, category="", **args):
+        self.spans += 1
+        return super().span(name, category, **args)
+
+    def count(self, name, amount=1):
+        self.counts += 1
+
+
+def _timed_profile_run(files, values, tracer):
+    """Yeni bir sahte profilde profil görevlerini çalıştır; (süre, temizleyici)"""
+    base = tempfile.mkdtemp(prefix="temizle-trace-")
+    try:
+        cleaner = profile_cleaner(build_profile(base, files, values=values))
+        cleaner.tracer = tracer
+        start = time.perf_counter()
+        cleaner.run_cleaning(list(PROFILE_TASKS) + ["recycle_bin"])
+        return time.perf_counter() - start, cleaner
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+def bench_trace(files, values, runs, output):
+    """Ölçüm kancalarının maliyeti: kapalıyken (boş uygulama) ve açıkken çalıştırma süresi"""
+    import timeit
+    null_seconds, recorder_seconds = [], []
+    for _ in range(runs):
+        null_seconds.append(_timed_profile_run(files, values, NULL_TRACER)[0])
+        seconds, cleaner = _timed_profile_run(files, values, TraceRecorder())
+        recorder_seconds.append(seconds)
+    recorder = cleaner.tracer
+    counting = _CountingTracer()
+    _timed_profile_run(files, values, counting)
+    if output:
+        recorder.export(output)
+
+    # Kapalı kancanın çağrı başına maliyeti ve bir çalıştırmadaki toplam payı
+    loops = 200_000
+    count_cost = min(timeit.repeat(lambda: NULL_TRACER.count("unlinks"), number=loops, repeat=5)) / loops
+    span_cost = min(timeit.repeat("with tracer.span('kök', 'walk'):\n    pass", globals={"tracer": NULL_TRACER},
+                                  number=loops, repeat=5)) / loops
+    null_median = statistics.median(null_seconds)
+    hook_seconds = counting.spans * span_cost + counting.counts * count_cost
+    events = recorder.to_dict()["traceEvents"]
+    return {
+        "benchmark": "trace",
+        "files": files,
+        "runs": runs,
+        "null_seconds": round(null_median, 4),
+        "recorder_seconds": round(statistics.median(recorder_seconds), 4),
+        "hook_calls": {"span": counting.spans, "count": counting.counts},
+        "null_call_ns": {"span": round(span_cost * 1e9, 1), "count": round(count_cost * 1e9, 1)},
+        "null_overhead_seconds": round(hook_seconds, 6),
+        "null_overhead_percent": round(100 * hook_seconds / null_median, 4),
+        "events": len(events),
+        "counters": dict(recorder.counters),
+        "output": output,
+        "checks": {
+            "null_overhead_below_1_percent": hook_seconds < 0.01 * null_median,
+            "task_spans": {event["name"] for event in events if event.get("cat") == "task"}
+            == set(PROFILE_TASKS) | {"recycle_bin"},
+            "walk_spans": any(event.get("cat") == "walk" for event in events),
+            "registry_spans": any(event.get("cat") == "registry" for event in events),
+            "counters": all(recorder.counters[name] > 0 for name in ("dir_reads", "stats", "unlinks", "rmdirs",
+                                                                       "registry_open")),
+        },
+    }
+
+
+def bench_metrics(files, runs, writes):
+    """Prometheus textfile: çalıştırma süresine göre yazma maliyeti (biçim tests/test_metrics.py'de denetlenir)"""
+    base = tempfile.mkdtemp(prefix="temizle-metrics-")
+    textfile = os.path.join(base, "textfile", "temizle.prom")
+    try:
+        run_seconds = []
+        for run in range(runs):
+            fixture = build_profile(os.path.join(base, f"profil{run}"), files)
+            cleaner = profile_cleaner(fixture)
+            cleaner.metrics = PrometheusTextfile.load(textfile)
+            start = time.perf_counter()
+            result = cleaner.run_cleaning(list(PROFILE_TASKS))
+            run_seconds.append(time.perf_counter() - start)
+        known_tasks = list(cleaner.task_functions())
+        with open(textfile, "r", encoding="utf-8") as f:
+            series = sum(1 for line in f if line.strip() and not line.startswith("#"))
+
+        # Yazma maliyeti: aynı sonucu tekrar tekrar kaydet (dosyaları da yazar)
+        metrics = PrometheusTextfile.load(textfile)
+        timings = []
+        for _ in range(writes):
+            start = time.perf_counter()
+            metrics.record(result, known_tasks)
+            timings.append(time.perf_counter() - start)
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+    write_median = statistics.median(timings)
+    return {
+        "benchmark": "metrics",
+        "runs": runs,
+        "series": series,
+        "run_seconds": round(statistics.median(run_seconds), 4),
+        "write_seconds": {"median": round(write_median, 6), "max": round(max(timings), 6)},
+        "write_percent_of_run": round(100 * write_median / statistics.median(run_seconds), 3),
+    }
+
+
+# Kayıtları yazıp aralık dolmadan ya da dolduktan sonra süreci temizlik yapmadan sonlandıran alt süreç
+_CRASH_SCRIPT = """
+import os, sys, time
+sys.path.insert(0, {package!r})
+from temizle import JsonLogWriter
+writer = JsonLogWriter({filename!r}, flush_interval={interval})
+for index in range({count}):
+    writer.write(f"kayıt {{index}}", "info", task="crash")
+time.sleep({wait})
+os._exit(1)
+"""
+
+
+def bench_log(records, max_size, backups):
+    """JSON satırları log yazıcısı: çağıran tarafın maliyeti, döndürme ve çökmede kaybolan kayıtlar"""
+    base = tempfile.mkdtemp(prefix="temizle-log-")
+    try:
+        # Çağıran iş parçacığının maliyeti: log_message, yazıcılı ve yazıcısız
+        cleaner = OfficeCleaner(environ={})
+        start = time.perf_counter()
+        for index in range(records):
+            cleaner.log_message(f"✓ Dosya temizlendi: dosya{index}.tmp", "success")
+        without_writer = time.perf_counter() - start
+        filename = os.path.join(base, "temizle-log.jsonl")
+        cleaner.log_writer = JsonLogWriter(filename, max_bytes=max_size, backups=backups)
+        start = time.perf_counter()
+        for index in range(records):
+            cleaner.log_message(f"✓ Dosya temizlendi: dosya{index}.tmp", "success")
+        with_writer = time.perf_counter() - start
+        flushed = cleaner.log_writer.flush(timeout=30)
+        drain_seconds = time.perf_counter() - start
+        files = cleaner.log_writer.files()
+        sizes = {os.path.basename(name): os.path.getsize(name) for name in files}
+        kept = [record["message"] for record in cleaner.log_writer.records()]
+        cleaner.log_writer.close()
+        dropped = cleaner.log_writer.dropped_total
+        numbers = [int(message.rsplit("dosya", 1)[1].split(".")[0]) for message in kept if "dosya" in message]
+        drop_notices = sum(1 for message in kept if "dosya" not in message)
+
+        # Çökme: kayıtlar aralıktan sonra diskte olmalı; aralık dolmadan çökülürse en çok o aralık kaybolur
+        crash = {}
+        for label, wait in (("after_interval", 0.8), ("immediately", 0.0)):
+            crash_file = os.path.join(base, f"cokme-{label}.jsonl")
+            subprocess.run([sys.executable, "-c", _CRASH_SCRIPT.format(
+                package=os.path.dirname(os.path.abspath(__file__)), filename=crash_file, interval=0.25,
+                count=1000, wait=wait)], check=False)
+            with open(crash_file, "r", encoding="utf-8") as f:
+                crash[label] = sum(1 for _ in f)
+
+        # Komut satırı: arayüzle aynı yazıcı
+        cli_file = os.path.join(base, "cli.jsonl")
+        output = subprocess.run([sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "temizle.py"),
+                                 "--tasks", "temp_files", "--dry-run", "--log-file", cli_file],
+                                capture_output=True, text=True, env={**os.environ, "TEMP": base,
+                                                                     "TEMIZLE_STATE_DIR": base})
+        cli_records = JsonLogWriter.__new__(JsonLogWriter)
+        cli_records.filename, cli_records.backups, cli_records.compress = cli_file, 0, True
+        cli_levels = {record["level"] for record in cli_records.records()}
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+    return {
+        "benchmark": "log",
+        "records": records,
+        "max_bytes": max_size,
+        "backups": backups,
+        "caller_us_per_record": {"without_writer": round(without_writer / records * 1e6, 2),
+                                 "with_writer": round(with_writer / records * 1e6, 2)},
+        "drain_seconds": round(drain_seconds, 3),
+        "files": sizes,
+        "kept_records": len(numbers),
+        "dropped_records": dropped,
+        "crash_records": crash,
+        "checks": {
+            "flushed": flushed,
+            "rotated_within_limit": all(size <= max_size for size in sizes.values()) and len(files) <= backups + 1,
+            "rotated_compressed": all(name.endswith(".gz") for name in sizes if name != "temizle-log.jsonl"),
+            "newest_records_kept_in_order": bool(numbers) and numbers == sorted(numbers) and numbers[-1] == records - 1,
+            # Kuyruk taşarsa düşen kayıtlar sessizce kaybolmaz, dosyada bildirilir
+            "drops_reported": (dropped == 0) == (drop_notices == 0),
+            "crash_after_interval_loses_nothing": crash["after_interval"] == 1000,
+            "cli_writes_same_format": output.returncode == 0 and {"info"} <= cli_levels,
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Temizleyici performans ölçümleri")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    matcher_parser = subparsers.add_parser("matcher", help="Anahtar kelime eşleştirici mikro ölçümü")
+    matcher_parser.add_argument("--count", type=int, default=1_000_000)
+
+    scheduler_parser = subparsers.add_parser("scheduler", help="Sıralı ve eşzamanlı görev çalıştırma karşılaştırması")
+    scheduler_parser.add_argument("--files", type=int, default=20_000)
+    scheduler_parser.add_argument("--workers", type=int, default=4)
+
+    tree_parser = subparsers.add_parser("tree-delete", help="shutil.rmtree ve paralel silici karşılaştırması")
+    tree_parser.add_argument("--files", type=int, default=100_000)
+    tree_parser.add_argument("--workers", type=int, default=8)
+
+    startup_parser = subparsers.add_parser("startup", help="Komut satırı başlangıç süresi")
+    startup_parser.add_argument("--runs", type=int, default=10)
+
+    profiles_parser = subparsers.add_parser("profiles", help="Tüm kullanıcı profillerinin taranması")
+    profiles_parser.add_argument("--count", type=int, default=50)
+    profiles_parser.add_argument("--files", type=int, default=400)
+    profiles_parser.add_argument("--workers", type=int, default=4)
+
+    hives_parser = subparsers.add_parser("hives", help="NTUSER.DAT hive'larının çevrimdışı taranması")
+    hives_parser.add_argument("--count", type=int, default=200)
+    hives_parser.add_argument("--values", type=int, default=2000)
+    hives_parser.add_argument("--workers", type=int, default=4)
+
+    stop_parser = subparsers.add_parser("stop", help="Durdurma gecikmesi (büyük ağaçta ve alt süreçte)")
+    stop_parser.add_argument("--files", type=int, default=100_000)
+    stop_parser.add_argument("--runs", type=int, default=3)
+    stop_parser.add_argument("--bound", type=float, default=1.0, help="kabul edilen en uzun gecikme (sn)")
+
+    incremental_parser = subparsers.add_parser("incremental", help="Değişmemiş ağaçta artımlı yeniden tarama")
+    incremental_parser.add_argument("--files", type=int, default=200_000)
+    incremental_parser.add_argument("--depth", type=int, default=4)
+
+    watch_parser = subparsers.add_parser("watch", help="İzleme modunun boşta maliyeti ve silme gecikmesi")
+    watch_parser.add_argument("--bursts", type=int, default=5)
+    watch_parser.add_argument("--burst-size", type=int, default=200)
+    watch_parser.add_argument("--idle", type=float, default=5.0, help="boşta ölçüm süresi (sn)")
+    watch_parser.add_argument("--poll-interval", type=float, default=2.0)
+
+    temp_parser = subparsers.add_parser("temp", help="Yaş ve kota politikalı temp temizliği")
+    temp_parser.add_argument("--files", type=int, default=200_000)
+    temp_parser.add_argument("--max-age", type=float, default=24.0, help="saat")
+    temp_parser.add_argument("--quota", default="20M")
+    temp_parser.add_argument("--locked-every", type=int, default=50, help="her N. dosya kilitli sayılır (0: hiç)")
+
+    recycle_parser = subparsers.add_parser("recycle", help="Geri dönüşüm kutusunun birimler üzerinde boşaltılması")
+    recycle_parser.add_argument("--volumes", type=int, default=3)
+    recycle_parser.add_argument("--files", type=int, default=30_000, help="birim başına dosya")
+    recycle_parser.add_argument("--depth", type=int, default=3)
+
+    methods_parser = subparsers.add_parser("recycle-methods", help="Geri dönüşüm kutusu yöntem önbelleğinin etkisi")
+    methods_parser.add_argument("--runs", type=int, default=12)
+    methods_parser.add_argument("--fail-seconds", type=float, default=1.0,
+                                help="sahte PowerShell komutunun başarısız olmadan önce beklediği süre")
+
+    trace_parser = subparsers.add_parser("trace", help="Ölçüm kancalarının kapalı ve açık maliyeti")
+    trace_parser.add_argument("--files", type=int, default=2000)
+    trace_parser.add_argument("--values", type=int, default=500)
+    trace_parser.add_argument("--runs", type=int, default=5)
+    trace_parser.add_argument("--output", help="açık çalıştırmanın Chrome trace dosyası")
+
+    metrics_parser = subparsers.add_parser("metrics", help="Prometheus textfile yazma maliyeti")
+    metrics_parser.add_argument("--files", type=int, default=2000)
+    metrics_parser.add_argument("--runs", type=int, default=3)
+    metrics_parser.add_argument("--writes", type=int, default=200)
+
+    log_parser = subparsers.add_parser("log", help="Arka plan JSON satırları log yazıcısı")
+    log_parser.add_argument("--records", type=int, default=100_000)
+    log_parser.add_argument("--max-size", default="1M")
+    log_parser.add_argument("--backups", type=int, default=3)
+
+    rules_parser = subparsers.add_parser("rules", help="Kural kataloğunu derleme ve önbellekten yükleme")
+    rules_parser.add_argument("--runs", type=int, default=50)
+
+    for name, help_text in (("fixture", "Sahte profil ve registry fikstürü oluştur"),
+                            ("cleaners", "Tüm clean_* yöntemlerini sahte profilde ölç")):
+        sub = subparsers.add_parser(name, help=help_text)
+        if name == "fixture":
+            sub.add_argument("directory")
+        sub.add_argument("--files", type=int, default=2000)
+        sub.add_argument("--size", type=int, default=1024)
+        sub.add_argument("--depth", type=int, default=3)
+        sub.add_argument("--values", type=int, default=500)
+        if name == "cleaners":
+            sub.add_argument("--no-memory", action="store_true", help="tracemalloc ölçümünü atla")
+            sub.add_argument("--output", help="sonuçların kaydedileceği JSON dosyası")
+
+    args = parser.parse_args(argv)
+    if args.command == "matcher":
+        result = bench_matcher(args.count)
+    elif args.command == "scheduler":
+        result = bench_scheduler(args.files, args.workers)
+    elif args.command == "tree-delete":
+        result = bench_tree_delete(args.files, args.workers)
+    elif args.command == "startup":
+        result = bench_startup(args.runs)
+    elif args.command == "profiles":
+        result = bench_profiles(args.count, args.files, args.workers)
+    elif args.command == "hives":
+        result = bench_hives(args.count, args.values, args.workers)
+    elif args.command == "stop":
+        result = bench_stop(args.files, args.runs, args.bound)
+    elif args.command == "incremental":
+        result = bench_incremental(args.files, args.depth)
+    elif args.command == "watch":
+        result = bench_watch(args.bursts, args.burst_size, args.idle, args.poll_interval)
+    elif args.command == "temp":
+        result = bench_temp(args.files, args.max_age, parse_size(args.quota) if args.quota else None,
+                            args.locked_every)
+    elif args.command == "recycle":
+        result = bench_recycle(args.volumes, args.files, args.depth)
+    elif args.command == "recycle-methods":
+        result = bench_recycle_methods(args.runs, args.fail_seconds)
+    elif args.command == "trace":
+        result = bench_trace(args.files, args.values, args.runs, args.output)
+    elif args.command == "metrics":
+        result = bench_metrics(args.files, args.runs, args.writes)
+    elif args.command == "log":
+        result = bench_log(args.records, parse_size(args.max_size), args.backups)
+    elif args.command == "rules":
+        result = bench_rules(args.runs)
+    elif args.command == "fixture":
+        os.makedirs(args.directory, exist_ok=True)
+        result = build_profile(args.directory, args.files, args.size, args.depth, args.values)
+    elif args.command == "cleaners":
+        result = bench_cleaners(args.files, args.size, args.depth, args.values, memory=not args.no_memory)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    # Sınırı aşan ya da doğruluk denetimi geçmeyen ölçüm başarısız çıkar (CI'da yakalanır)
+    failed = [name for name, passed in result.get("checks", {}).items() if not passed]
+    if failed:
+        print(f"Başarısız denetimler: {', '.join(failed)}", file=sys.stderr)
+    if result.get("within_bound") is False or failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Grafik arayüzün sahte Tk ile kurulabildiğini denetler (ekran gerekmez)"""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import temizle
+
+
+def stub_root():
+    """Pencere ölçüleri sayı döndüren sahte Tk kök penceresi"""
+    root = mock.MagicMock(name="root")
+    root.winfo_width.return_value = 800
+    root.winfo_height.return_value = 600
+    root.winfo_screenwidth.return_value = 1920
+    root.winfo_screenheight.return_value = 1080
+    return root
+
+
+class GuiSmokeTest(unittest.TestCase):
+    def setUp(self):
+        state = tempfile.TemporaryDirectory()
+        self.addCleanup(state.cleanup)
+        modules = {name: mock.MagicMock(name=name)
+                   for name in ("tk", "ttk", "messagebox", "scrolledtext", "tkFont")}
+        patches = [mock.patch.multiple(temizle, **modules),
+                   mock.patch.dict(os.environ, {"TEMIZLE_STATE_DIR": state.name})]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_builds_with_stubbed_tk(self):
+        root = stub_root()
+        gui = temizle.ModernOfficeCleanerGUI(root)
+        self.addCleanup(gui.log_writer.close)
+        self.assertFalse(gui.dry_run)
+        self.assertIsNotNone(gui.log_writer)
+        # Başlangıç mesajları widget kurulurken kuyruğa ve log dosyasına yazılır
+        messages = [text for text, _level in gui.log_queue.drain(100)]
+        self.assertTrue(any("hazır" in text for text in messages))
+        gui.log_writer.flush()
+        self.assertTrue(any("hazır" in record["message"] for record in gui.log_writer.records()))
+        root.after.assert_called_with(gui.LOG_FLUSH_MS, gui.flush_ui)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+"""Artımlı tarama günlüğünün (ScanJournal) dosya biçimini ve atlama kararlarını denetler"""
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import temizle
+
+KEY = "katalog-ozeti"
+
+
+def age_directories(root, seconds=3600):
+    """root altındaki dizinlerin mtime'ını geriye al (RACY_NS penceresinin dışına çıkar)"""
+    past = time.time() - seconds
+    for directory, _, _ in os.walk(root):
+        os.utime(directory, (past, past))
+
+
+def touch(path):
+    with open(path, "wb") as f:
+        f.write(b"x")
+
+
+class ScanJournalTest(unittest.TestCase):
+    def setUp(self):
+        base = tempfile.mkdtemp(prefix="temizle-journal-test-")
+        self.addCleanup(shutil.rmtree, base, True)
+        self.root = os.path.join(base, "Cache")
+        self.deep = os.path.join(self.root, "a", "b", "c")
+        os.makedirs(self.deep)
+        os.makedirs(os.path.join(self.root, "x", "y"))
+        for directory in (self.root, os.path.join(self.root, "a"), self.deep, os.path.join(self.root, "x", "y")):
+            touch(os.path.join(directory, "veri.bin"))
+        self.dir_count = 6
+        self.filename = os.path.join(base, "gunluk.json")
+        age_directories(self.root)
+
+    def scan(self, journal, delete=True):
+        """Kök altında adında "recent" geçen dosyaları bul; delete False ise yerinde bırak (önizleme)"""
+        planner = temizle.ScanPlanner([temizle.ScanRule("recent_cache", [self.root], keywords=["recent"])])
+        found = []
+
+        def handle(entry, rules):
+            found.append(entry.path)
+            if delete:
+                os.remove(entry.path)
+            return delete
+
+        planner.run(handle, journal=journal)
+        if journal is not None:
+            journal.save()
+        return planner, found
+
+    def load(self, key=KEY):
+        return temizle.ScanJournal.load(self.filename, key=key)
+
+    def section(self, journal):
+        return journal.sections["recent_cache"]
+
+    def test_round_trip(self):
+        journal = self.load()
+        self.assertFalse(journal.invalidated)
+        planner, _ = self.scan(journal)
+        self.assertEqual(planner.dir_reads, self.dir_count)
+
+        with open(self.filename, encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(data["version"], temizle.ScanJournal.VERSION)
+        self.assertEqual(data["key"], KEY)
+        entry = data["sections"]["recent_cache"][temizle._path_key(os.path.join(self.root, "a"))]
+        mtime_ns, read_ns, clean, subdirs = entry
+        self.assertEqual(mtime_ns, os.stat(os.path.join(self.root, "a")).st_mtime_ns)
+        self.assertGreaterEqual(read_ns - mtime_ns, temizle.ScanJournal.RACY_NS)
+        self.assertTrue(clean)
+        self.assertEqual(subdirs, ["b"])
+
+        loaded = self.load()
+        self.assertEqual(loaded.sections, journal.sections)
+        # Değişmemiş ağaçta hiçbir dizin yeniden okunmaz
+        planner, _ = self.scan(loaded)
+        self.assertEqual(planner.dir_reads, 0)
+        self.assertEqual(planner.skipped_dirs, self.dir_count)
+
+    def assert_full_scan(self, journal):
+        self.assertEqual(journal.sections, {})
+        planner, _ = self.scan(journal)
+        self.assertEqual(planner.dir_reads, self.dir_count)
+        self.assertEqual(planner.skipped_dirs, 0)
+
+    def test_corrupt_file_falls_back_to_full_scan(self):
+        self.scan(self.load())
+        with open(self.filename, "w", encoding="utf-8") as f:
+            f.write('{"version": 1, "key": "katalog-oz')
+        self.assert_full_scan(self.load())
+
+    def test_old_version_falls_back_to_full_scan(self):
+        self.scan(self.load())
+        with open(self.filename, encoding="utf-8") as f:
+            data = json.load(f)
+        data["version"] = temizle.ScanJournal.VERSION - 1
+        with open(self.filename, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        journal = self.load()
+        self.assertTrue(journal.invalidated)
+        self.assert_full_scan(journal)
+
+    def test_catalog_change_falls_back_to_full_scan(self):
+        self.scan(self.load())
+        journal = self.load(key="baska-katalog")
+        self.assertTrue(journal.invalidated)
+        self.assert_full_scan(journal)
+
+    def test_subtree_left_dirty_is_rescanned(self):
+        planted = os.path.join(self.deep, "recent_liste.json")
+        touch(planted)
+        age_directories(self.root)
+        # Önizleme eşleşen dosyayı yerinde bırakır: dizin "temiz değil" yazılır
+        _, found = self.scan(self.load(), delete=False)
+        self.assertEqual(found, [planted])
+        self.assertFalse(self.section(self.load())[temizle._path_key(self.deep)][2])
+
+        planner, found = self.scan(self.load())
+        self.assertEqual(found, [planted])
+        self.assertFalse(os.path.exists(planted))
+        self.assertEqual(planner.dir_reads, 1)
+
+    def test_child_change_without_parent_mtime_change(self):
+        self.scan(self.load())
+        parent = os.path.join(self.root, "a", "b")
+        parent_mtime = os.stat(parent).st_mtime_ns
+        planted = os.path.join(self.deep, "recent_yeni.json")
+        touch(planted)
+        # Derindeki dizine eklenen dosya üst dizinlerin mtime'ını değiştirmez
+        self.assertEqual(os.stat(parent).st_mtime_ns, parent_mtime)
+
+        planner, found = self.scan(self.load())
+        self.assertEqual(found, [planted])
+        self.assertFalse(os.path.exists(planted))
+        self.assertEqual(planner.dir_reads, 1)
+        self.assertEqual(planner.skipped_dirs, self.dir_count - 1)
+
+    def test_deleted_directories(self):
+        self.scan(self.load())
+        removed = os.path.join(self.root, "a", "b")
+        shutil.rmtree(removed)
+
+        planner, _ = self.scan(self.load())
+        # Üst dizin (mtime'ı değişti) okunur; silinen alt ağacın kayıtları günlükten çıkar
+        self.assertEqual(planner.dir_reads, 1)
+        removed_key = temizle._path_key(removed)
+        section = self.section(self.load())
+        self.assertEqual([key for key in section if key == removed_key or temizle._is_under(key, removed_key)], [])
+        self.assertEqual(section[temizle._path_key(os.path.join(self.root, "a"))][3], [])
+
+        # Kökün kendisi silinince de tarama hatasız biter ve kayıtlar temizlenir
+        shutil.rmtree(self.root)
+        planner, _ = self.scan(self.load())
+        self.assertEqual(planner.dir_reads, 0)
+        self.assertEqual(self.section(self.load()), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+"""JsonLogWriter'ın kapatıldıktan sonra çıkış kancasında tutulmadığını denetler"""
+import gc
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import weakref
+
+import temizle
+
+
+class JsonLogWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.base = tempfile.mkdtemp(prefix="temizle-log-test-")
+        self.addCleanup(shutil.rmtree, self.base, True)
+
+    def writer(self, name="temizle-log.jsonl"):
+        return temizle.JsonLogWriter(os.path.join(self.base, name))
+
+    def test_closed_writer_is_released(self):
+        refs = []
+        for index in range(5):
+            writer = self.writer(f"log{index}.jsonl")
+            writer.write("ileti")
+            writer.close()
+            refs.append(weakref.ref(writer))
+        del writer
+        gc.collect()
+        self.assertEqual([ref for ref in refs if ref() is not None], [])
+
+    def test_close_writes_pending_records_and_is_repeatable(self):
+        writer = self.writer()
+        writer.write("birinci")
+        writer.write("ikinci", "warning")
+        writer.close()
+        writer.close()
+        with open(writer.filename, encoding="utf-8") as f:
+            messages = [json.loads(line)["message"] for line in f]
+        self.assertEqual(messages, ["birinci", "ikinci"])
+
+
+if __name__ == "__main__":
+    unittest.main()
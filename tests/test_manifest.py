@@ -0,0 +1,41 @@
+"""Önizlemede aynı öğeyi bulan ikinci temizleyicinin kazanılan alanı şişirmediğini denetler"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import temizle
+
+
+class DryRunReclaimTest(unittest.TestCase):
+    def setUp(self):
+        self.base = tempfile.mkdtemp(prefix="temizle-manifest-test-")
+        self.addCleanup(shutil.rmtree, self.base, True)
+        self.folder = os.path.join(self.base, "Recent")
+        os.makedirs(self.folder)
+        self.path = os.path.join(self.folder, "rapor.docx.lnk")
+        with open(self.path, "wb") as handle:
+            handle.write(b"x" * 100)
+        self.cleaner = temizle.OfficeCleaner(environ={}, registry_backend=temizle.MemoryRegistryBackend())
+        self.addCleanup(self.cleaner.reaper.stop)
+        self.cleaner.dry_run = True
+        self.cleaner.manifest = temizle.DeletionManifest()
+        self.cleaner.reclaim = temizle.ReclaimTracker()
+
+    def test_duplicate_entries_counted_once(self):
+        for task in ("recent_docs", "office_history"):
+            self.cleaner._task_context.name = task
+            self.cleaner.remove_file(self.path)
+            self.cleaner.remove_dir(self.folder)
+        totals = self.cleaner.reclaim.totals()
+        self.assertEqual(len(self.cleaner.manifest), 2)
+        self.assertEqual((totals["files"], totals["dirs"], totals["bytes"]), (1, 1, 100))
+        self.assertEqual(totals["bytes"], self.cleaner.manifest.total_size)
+        # Öğeyi ilk bulan görev sayılır
+        self.assertEqual(self.cleaner.reclaim.tasks["recent_docs"]["files"], 1)
+        self.assertNotIn("office_history", self.cleaner.reclaim.tasks)
+        self.assertTrue(os.path.exists(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,227 @@
+"""Prometheus textfile çıktısının biçimi: metrik adları, tipleri, etiketleri ve çalıştırmalar arası birikme
+
+Bu dosyadaki tablolar çıktının belgelenmiş şemasıdır; bir metriği değiştirmek panoları bozar.
+"""
+import os
+import re
+import shutil
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+import temizle
+
+# ad -> (tip, HELP metni, etiketler)
+EXPECTED_METRICS = {
+    "temizle_task_duration_seconds": ("histogram", "Görev süresi (saniye)", ("task",)),
+    "temizle_task_runs_total": ("counter", "Görev çalıştırmaları (status: ok, error)", ("task", "status")),
+    "temizle_files_removed_total": ("counter", "Silinen dosyalar", ("task",)),
+    "temizle_dirs_removed_total": ("counter", "Silinen klasörler", ("task",)),
+    "temizle_bytes_reclaimed_total": ("counter", "Silinen dosyaların toplam boyutu (bayt)", ("task",)),
+    "temizle_registry_values_removed_total": ("counter", "Silinen registry değerleri", ("task",)),
+    "temizle_registry_keys_removed_total": ("counter", "Silinen registry anahtarları", ("task",)),
+    "temizle_items_failed_total": ("counter", "Silinemeyen öğeler (kullanımda, erişim engelli)", ("task",)),
+    "temizle_runs_total": ("counter", "Temizlik çalıştırmaları (result: ok, error, cancelled)", ("result",)),
+    "temizle_last_run_timestamp_seconds": ("gauge", "Son çalıştırmanın bittiği an (Unix zamanı)", ()),
+    "temizle_last_run_duration_seconds": ("gauge", "Son çalıştırmanın süresi (saniye)", ()),
+    "temizle_last_run_success": ("gauge", "Son çalıştırma hatasız tamamlandıysa 1", ()),
+}
+BUCKET_LABELS = ["0.1", "0.5", "1.0", "2.5", "5.0", "10.0", "30.0", "60.0", "120.0", "300.0", "600.0", "+Inf"]
+TASK_COUNTERS = ["temizle_files_removed_total", "temizle_dirs_removed_total", "temizle_bytes_reclaimed_total",
+                 "temizle_registry_values_removed_total", "temizle_registry_keys_removed_total",
+                 "temizle_items_failed_total"]
+
+SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})? (\S+)$')
+LABEL = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"(?:,|$)')
+
+
+def parse(text):
+    """Metin biçimini (HELP satırları, TYPE satırları, [(ad, {etiket: ham değer}, değer)]) olarak ayrıştır"""
+    helps, types, samples = {}, {}, []
+    for line in text.splitlines():
+        if line.startswith("# HELP "):
+            name, _, help_text = line[7:].partition(" ")
+            helps[name] = help_text
+        elif line.startswith("# TYPE "):
+            name, _, kind = line[7:].partition(" ")
+            types[name] = kind
+        else:
+            match = SAMPLE.match(line)
+            assert match is not None, f"geçersiz satır: {line!r}"
+            samples.append((match.group(1), dict(LABEL.findall(match.group(2) or "")), float(match.group(3))))
+    return helps, types, samples
+
+
+def task_result(status="ok", duration=0.3, **counts):
+    result = {"status": status, "error": None, "duration_seconds": duration,
+              "files": 0, "dirs": 0, "bytes": 0, "registry_values": 0, "registry_keys": 0}
+    result.update(counts)
+    return result
+
+
+class PrometheusTextfileTest(unittest.TestCase):
+    def setUp(self):
+        base = tempfile.mkdtemp(prefix="temizle-metrics-test-")
+        self.addCleanup(shutil.rmtree, base, True)
+        self.filename = os.path.join(base, "textfile", "temizle.prom")
+        cleaner = temizle.OfficeCleaner(environ={}, registry_backend=temizle.MemoryRegistryBackend())
+        self.addCleanup(cleaner.reaper.stop)
+        self.tasks = list(cleaner.task_functions())
+        tasks = {task: task_result("skipped", 0.0) for task in self.tasks}
+        tasks["temp_files"] = task_result(duration=0.3, files=10, dirs=2, bytes=4096, locked=3)
+        tasks["office_history"] = task_result(duration=7.5, files=4, registry_values=6, registry_keys=1)
+        tasks["recycle_bin"] = task_result("error", duration=1.0, volumes={"C:\\": {"failed": 2}})
+        self.results = {"tasks": tasks, "cancelled": False, "duration_seconds": 8.8}
+
+    def record(self):
+        metrics = temizle.PrometheusTextfile.load(self.filename)
+        metrics.clock = lambda: 1_700_000_000.0
+        metrics.record(self.results, self.tasks)
+        with open(self.filename, encoding="utf-8") as f:
+            return parse(f.read())
+
+    def series(self, samples, name):
+        return {tuple(sorted(labels.items())): value for sample, labels, value in samples if sample == name}
+
+    def test_names_types_and_help(self):
+        helps, types, samples = self.record()
+        self.assertEqual(types, {name: kind for name, (kind, _, _) in EXPECTED_METRICS.items()})
+        self.assertEqual(helps, {name: help_text for name, (_, help_text, _) in EXPECTED_METRICS.items()})
+        self.assertEqual(temizle.PrometheusTextfile.METRICS, EXPECTED_METRICS)
+        for name, labels, _ in samples:
+            family = re.sub(r"_(bucket|sum|count)$", "", name) if name not in EXPECTED_METRICS else name
+            expected = set(EXPECTED_METRICS[family][2]) | ({"le"} if name.endswith("_bucket") else set())
+            self.assertEqual(set(labels), expected, name)
+
+    def test_labels_and_values(self):
+        _, _, samples = self.record()
+        runs = self.series(samples, "temizle_task_runs_total")
+        self.assertEqual(runs[(("status", "ok"), ("task", "temp_files"))], 1)
+        self.assertEqual(runs[(("status", "error"), ("task", "recycle_bin"))], 1)
+        self.assertEqual(runs[(("status", "ok"), ("task", "recycle_bin"))], 0)
+        self.assertEqual(self.series(samples, "temizle_runs_total"),
+                         {(("result", "ok"),): 0, (("result", "error"),): 1, (("result", "cancelled"),): 0})
+        self.assertEqual(self.series(samples, "temizle_bytes_reclaimed_total")[(("task", "temp_files"),)], 4096)
+        failed = self.series(samples, "temizle_items_failed_total")
+        self.assertEqual(failed[(("task", "temp_files"),)], 3)
+        self.assertEqual(failed[(("task", "recycle_bin"),)], 2)
+        self.assertEqual(self.series(samples, "temizle_last_run_success"), {(): 0})
+        self.assertEqual(self.series(samples, "temizle_last_run_timestamp_seconds"), {(): 1_700_000_000.0})
+
+    def test_zero_series_for_every_task(self):
+        _, _, samples = self.record()
+        for task in self.tasks:
+            with self.subTest(task=task):
+                for name in TASK_COUNTERS:
+                    self.assertIn((("task", task),), self.series(samples, name))
+                runs = self.series(samples, "temizle_task_runs_total")
+                for status in ("ok", "error"):
+                    self.assertIn((("status", status), ("task", task)), runs)
+                self.assertIn((("task", task),), self.series(samples, "temizle_task_duration_seconds_count"))
+        prefetch = (("task", "prefetch"),)
+        self.assertEqual(self.series(samples, "temizle_files_removed_total")[prefetch], 0)
+        self.assertEqual(self.series(samples, "temizle_task_duration_seconds_count")[prefetch], 0)
+
+    def test_histogram_bucket_layout(self):
+        _, _, samples = self.record()
+        buckets = [(labels["le"], value) for name, labels, value in samples
+                   if name == "temizle_task_duration_seconds_bucket" and labels["task"] == "office_history"]
+        self.assertEqual([le for le, _ in buckets], BUCKET_LABELS)
+        # 7.5 sn: 10.0 kovasından itibaren sayılır (kovalar birikimlidir)
+        self.assertEqual([value for _, value in buckets], [0, 0, 0, 0, 0] + [1] * 7)
+        task = (("task", "office_history"),)
+        self.assertEqual(self.series(samples, "temizle_task_duration_seconds_count")[task], 1)
+        self.assertEqual(self.series(samples, "temizle_task_duration_seconds_sum")[task], 7.5)
+
+    def test_label_escaping(self):
+        task = 'görev "a"\\b\nc'
+        self.tasks.append(task)
+        self.results["tasks"][task] = task_result(files=1)
+        with_task = temizle.PrometheusTextfile.load(self.filename)
+        with_task.record(self.results, self.tasks)
+        text = with_task.render()
+        self.assertIn('temizle_files_removed_total{task="görev \\"a\\"\\\\b\\nc"} 1', text)
+        # Kaçışlı değer satırı bölmez; her satır geçerli bir örnek veya yorumdur
+        _, _, samples = parse(text)
+        self.assertIn((("task", 'görev \\"a\\"\\\\b\\nc'),), self.series(samples, "temizle_files_removed_total"))
+
+    def test_accumulates_across_load_and_save(self):
+        self.record()
+        self.results["cancelled"] = True
+        self.results["tasks"]["temp_files"]["duration_seconds"] = 45.0
+        _, _, samples = self.record()
+        task = (("task", "temp_files"),)
+        self.assertEqual(self.series(samples, "temizle_files_removed_total")[task], 20)
+        self.assertEqual(self.series(samples, "temizle_bytes_reclaimed_total")[task], 8192)
+        self.assertEqual(self.series(samples, "temizle_task_runs_total")[(("status", "ok"),) + task], 2)
+        self.assertEqual(self.series(samples, "temizle_task_duration_seconds_count")[task], 2)
+        self.assertEqual(self.series(samples, "temizle_task_duration_seconds_sum")[task], 45.3)
+        self.assertEqual(self.series(samples, "temizle_runs_total"),
+                         {(("result", "ok"),): 0, (("result", "error"),): 1, (("result", "cancelled"),): 1})
+        # Son çalıştırma göstergeleri birikmez, değiştirilir
+        self.assertEqual(self.series(samples, "temizle_last_run_duration_seconds"), {(): 8.8})
+
+    def test_files_on_disk(self):
+        self.record()
+        directory = os.path.dirname(self.filename)
+        self.assertEqual(sorted(os.listdir(directory)), ["temizle.json", "temizle.prom"])
+        if os.name != "nt":
+            # Toplayıcı başka bir kullanıcıyla çalışır
+            self.assertEqual(stat.S_IMODE(os.stat(self.filename).st_mode) & 0o044, 0o044)
+
+
+class ProfileSweepMetricsTest(unittest.TestCase):
+    PROFILES = ("ayse", "burak", "cem", "deniz", "ece")
+    FILES = 6
+
+    def setUp(self):
+        base = tempfile.mkdtemp(prefix="temizle-metrics-sweep-test-")
+        self.addCleanup(shutil.rmtree, base, True)
+        self.root = os.path.join(base, "Users")
+        for user in self.PROFILES:
+            cache = os.path.join(self.root, user, "AppData", "Local", "Google", "Chrome", "User Data",
+                                 "Default", "Cache")
+            os.makedirs(cache)
+            for number in range(self.FILES):
+                with open(os.path.join(cache, f"f{number}"), "wb") as f:
+                    f.write(b"x")
+        self.filename = os.path.join(base, "textfile", "temizle.prom")
+
+    def test_sweep_is_recorded_as_one_run(self):
+        cleaner = temizle.OfficeCleaner(environ={}, registry_backend=temizle.MemoryRegistryBackend())
+        self.addCleanup(cleaner.reaper.stop)
+        cleaner.metrics = temizle.PrometheusTextfile.load(self.filename)
+        with mock.patch.object(cleaner.metrics, "save", wraps=cleaner.metrics.save) as save:
+            cleaner.run_profile_sweep(self.root, tasks=["browser_cache", "temp_files"], profile_workers=3)
+        # Dosyalar profil başına değil, tarama sonunda bir kez yazılır
+        self.assertEqual(save.call_count, 1)
+        with open(self.filename, encoding="utf-8") as f:
+            _, _, samples = parse(f.read())
+        series = {(name, tuple(sorted(labels.items()))): value for name, labels, value in samples}
+        self.assertEqual(series[("temizle_runs_total", (("result", "ok"),))], 1)
+        self.assertEqual(series[("temizle_task_runs_total", (("status", "ok"), ("task", "browser_cache")))], 1)
+        self.assertEqual(series[("temizle_task_duration_seconds_count", (("task", "browser_cache"),))], 1)
+        # Görev sayıları profiller üzerinden toplanır
+        self.assertEqual(series[("temizle_files_removed_total", (("task", "browser_cache"),))],
+                         len(self.PROFILES) * self.FILES)
+        self.assertEqual(series[("temizle_task_runs_total", (("status", "ok"), ("task", "prefetch")))], 0)
+
+    def test_sweep_task_results_marks_errors(self):
+        profiles = {
+            "a": {"tasks": {"temp_files": task_result(duration=0.25, files=2, locked=1)}},
+            "b": {"tasks": {"temp_files": task_result("error", duration=0.5, files=3)}},
+            "c": {"tasks": {"temp_files": task_result("skipped", duration=0.0)}},
+        }
+        merged = temizle.OfficeCleaner.sweep_task_results(["temp_files", "browser_cache"], profiles)
+        self.assertEqual(merged["temp_files"]["status"], "error")
+        self.assertEqual((merged["temp_files"]["files"], merged["temp_files"]["locked"]), (5, 1))
+        self.assertEqual(merged["temp_files"]["duration_seconds"], 0.75)
+        self.assertEqual(merged["browser_cache"]["status"], "skipped")
+        profiles["d"] = {"error": "okunamadı"}
+        self.assertEqual(temizle.OfficeCleaner.sweep_task_results(["browser_cache"], profiles)
+                         ["browser_cache"]["status"], "error")
+
+
+if __name__ == "__main__":
+    unittest.main()
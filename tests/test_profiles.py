@@ -0,0 +1,57 @@
+"""Profil taramasının profil başına başlangıç işini tekrarlamadığını ve silici havuzunu paylaştığını denetler"""
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import temizle
+
+
+class ProfileSweepTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="temizle-profiles-test-")
+        self.addCleanup(shutil.rmtree, self.root, True)
+        self.caches = []
+        for user in ("ayse", "burak", "cem", "deniz", "ece"):
+            cache = os.path.join(self.root, user, "AppData", "Local", "Google", "Chrome", "User Data",
+                                 "Default", "Cache")
+            for index in range(3):
+                os.makedirs(os.path.join(cache, f"d{index}"))
+                for number in range(20):
+                    with open(os.path.join(cache, f"d{index}", f"f{number}"), "wb") as f:
+                        f.write(b"x")
+            self.caches.append(cache)
+        self.cleaner = temizle.OfficeCleaner(environ={}, registry_backend=temizle.MemoryRegistryBackend())
+        self.addCleanup(self.cleaner.reaper.stop)
+
+    def test_profiles_share_startup_work_and_deleter(self):
+        with mock.patch.object(temizle, "default_registry_backend") as default_registry, \
+                mock.patch.object(temizle.OfficeCleaner, "resume_tombstones") as resume, \
+                mock.patch.object(temizle, "ParallelTreeDeleter", wraps=temizle.ParallelTreeDeleter) as deleters:
+            results = self.cleaner.run_profile_sweep(self.root, tasks=["browser_cache"], profile_workers=4)
+        self.assertEqual(len(results["profiles"]), 5)
+        default_registry.assert_not_called()
+        resume.assert_not_called()
+        deleters.assert_not_called()
+        for cache in self.caches:
+            self.assertFalse(os.path.exists(cache))
+        # Paylaşılan havuz tarama sonunda kapatılır; boşta iş parçacığı kalmaz
+        self.assertEqual([thread.name for thread in threading.enumerate()
+                          if thread.name.startswith("temizlik-sil")], [])
+
+    def test_profile_without_hive_has_no_registry(self):
+        with mock.patch.object(temizle.OfficeCleaner, "run_cleaning", autospec=True,
+                               return_value={}) as run_cleaning:
+            self.cleaner.run_profile_sweep(self.root, tasks=["office_history"], profile_workers=1)
+        children = [call.args[0] for call in run_cleaning.call_args_list]
+        self.assertEqual(len(children), 5)
+        for child in children:
+            self.assertIsNone(child.registry_backend)
+            self.assertIs(child.tree_deleter, self.cleaner.tree_deleter)
+            self.assertIs(child.reaper, self.cleaner.reaper)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Geri dönüşüm kutusunun Python yöntemi: birim başına sayılar, silinemeyen ve erişilemeyen öğeler"""
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+import temizle
+from benchmark import build_recycle_bins
+
+
+class FakeVolumeCleaner(temizle.OfficeCleaner):
+    """Sistem geri dönüşüm kutusu yerine sahte kökleri boşaltan, bazı dosyaları silemeyen temizleyici"""
+
+    def __init__(self, roots, locked=()):
+        super().__init__(environ={}, registry_backend=temizle.MemoryRegistryBackend())
+        self.roots = roots
+        self.locked = set(locked)
+        self.background_delete = False
+
+    def recycle_bin_roots(self):
+        return self.roots
+
+    def remove_file(self, path, entry=None, dry_run=None):
+        if path in self.locked:
+            raise PermissionError(13, "dosya başka bir işlem tarafından kullanılıyor", path)
+        return super().remove_file(path, entry, dry_run)
+
+
+def leftovers(root):
+    return sum(len(dirs) + len(names) for _, dirs, names in os.walk(root))
+
+
+class RecycleBinPythonTest(unittest.TestCase):
+    def setUp(self):
+        self.base = tempfile.mkdtemp(prefix="temizle-recycle-test-")
+        self.addCleanup(shutil.rmtree, self.base, True)
+        self.bins = build_recycle_bins(self.base, volumes=2, files=300, depth=3)
+        self.roots = sorted(self.bins)
+
+    def run_cleaner(self, locked=(), unreadable=()):
+        """Python yöntemiyle boşalt; yöntem önbelleği ve sahte komutlarla (çağrılan komutlar, birimler)"""
+        cleaner = FakeVolumeCleaner(self.roots, locked)
+        self.addCleanup(cleaner.reaper.stop)
+        cleaner.recycle_method_cache = temizle.RecycleMethodCache(os.path.join(self.base, "yontemler.json"),
+                                                                  host="test")
+        calls = []
+
+        def executor(args, timeout):
+            # Komutlar başarısız olur; böylece sonuçta Python yönteminin birim sayıları kalır
+            calls.append(args[0])
+            raise subprocess.CalledProcessError(1, args)
+        cleaner.command_executor = executor
+        scandir = os.scandir
+
+        def guarded_scandir(path):
+            if path in unreadable:
+                raise PermissionError(13, "Erişim engellendi", path)
+            return scandir(path)
+
+        with mock.patch.object(temizle.os, "scandir", guarded_scandir):
+            result = cleaner.run_cleaning(["recycle_bin"])
+        self.cleaner = cleaner
+        return calls, result["tasks"]["recycle_bin"]["volumes"]
+
+    def test_per_volume_counts(self):
+        calls, volumes = self.run_cleaner()
+        self.assertEqual(calls, [])
+        for root, (files, dirs, size) in self.bins.items():
+            self.assertEqual(volumes[root], {"files": files, "dirs": dirs, "bytes": size, "failed": 0, "denied": 0})
+            self.assertEqual(leftovers(root), 0)
+
+    def test_locked_file_counted_once(self):
+        root = self.roots[0]
+        locked = next(os.path.join(directory, names[0]) for directory, _, names in os.walk(root)
+                      if names and directory.count(os.sep) - root.count(os.sep) >= 3)
+        _, volumes = self.run_cleaner(locked={locked})
+        # Üst klasörlerin rmdir'i (boş değil) ayrıca sayılmaz
+        self.assertEqual(volumes[root]["failed"], 1)
+        self.assertTrue(os.path.exists(locked))
+        self.assertEqual(self.cleaner.recycle_method_cache.methods["python"]["last"], "failed")
+
+    def test_unreadable_folder_counted_once(self):
+        root = self.roots[0]
+        folder = next(os.path.join(directory, dirs[0])
+                      for directory, dirs, _ in os.walk(os.path.join(root, "S-1-5-21-0")) if dirs)
+        _, volumes = self.run_cleaner(unreadable={folder})
+        self.assertEqual((volumes[root]["failed"], volumes[root]["denied"]), (1, 0))
+        self.assertTrue(os.path.isdir(folder))
+
+    def test_foreign_sid_folder_is_not_a_method_failure(self):
+        root = self.roots[0]
+        foreign = os.path.join(root, "S-1-5-21-2")
+        calls, volumes = self.run_cleaner(unreadable={foreign})
+        self.assertEqual((volumes[root]["failed"], volumes[root]["denied"]), (0, 1))
+        self.assertTrue(os.path.isdir(foreign))
+        # Python yöntemi başarılı sayılır; sistem komutlarına sıra gelmez
+        self.assertEqual(calls, [])
+        self.assertEqual(self.cleaner.recycle_method_cache.methods["python"]["last"], "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
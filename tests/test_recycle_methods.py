@@ -0,0 +1,180 @@
+"""Geri dönüşüm kutusu yöntem önbelleği: sıralama, atlama, yeniden sınama ve sahte komutlarla çalıştırma"""
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+import temizle
+
+Cache = temizle.RecycleMethodCache
+
+
+class FakeVolumeCleaner(temizle.OfficeCleaner):
+    """Sistem geri dönüşüm kutusu yerine sahte bir kökü boşaltan, bazı dosyaları silemeyen temizleyici"""
+
+    def __init__(self, roots, locked=()):
+        super().__init__(environ={}, registry_backend=temizle.MemoryRegistryBackend())
+        self.roots = roots
+        self.locked = set(locked)
+        self.background_delete = False
+
+    def recycle_bin_roots(self):
+        return self.roots
+
+    def remove_file(self, path, entry=None, dry_run=None):
+        if os.path.basename(path) in self.locked:
+            raise PermissionError(13, "dosya başka bir işlem tarafından kullanılıyor", path)
+        return super().remove_file(path, entry, dry_run)
+
+
+class RecycleMethodCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.base = tempfile.mkdtemp(prefix="temizle-methods-test-")
+        self.addCleanup(shutil.rmtree, self.base, True)
+        self.filename = os.path.join(self.base, Cache.FILE_NAME)
+        self.now = 1_700_000_000.0
+
+    def cache(self, host="test"):
+        cache = Cache.load(self.filename, host=host)
+        cache.clock = lambda: self.now
+        return cache
+
+    def test_likelihood_ordering(self):
+        cache = self.cache()
+        names = ["shell", "python", "powershell", "cmd"]
+        # Hiç denenmemiş yöntemler eşittir; verilen sıra korunur
+        self.assertEqual(cache.plan(names)[0], names)
+        cache.record("shell", "unavailable", 0.0)
+        cache.record("python", "failed", 0.2)
+        cache.record("cmd", "ok", 0.5)
+        cache.record("cmd", "ok", 0.5)
+        self.assertEqual([round(cache.likelihood(name), 3) for name in names], [0.333, 0.333, 0.5, 0.75])
+        self.assertEqual(cache.plan(names)[0], ["cmd", "powershell", "shell", "python"])
+        # Eşit olasılıkta hızlı olan önce denenir
+        fresh = Cache(self.filename, host="test")
+        fresh.record("powershell", "ok", 2.0)
+        fresh.record("python", "ok", 0.1)
+        self.assertEqual(fresh.plan(["powershell", "python"])[0], ["python", "powershell"])
+
+    def test_skip_then_retest_after_runs(self):
+        cache = self.cache()
+        cache.record("powershell", "failed", 30.0)
+        for _ in range(Cache.RETEST_RUNS):
+            self.assertEqual(cache.plan(["python", "powershell"], skippable=["powershell"]),
+                             (["python"], ["powershell"]))
+        self.assertEqual(cache.plan(["python", "powershell"], skippable=["powershell"]),
+                         (["python", "powershell"], []))
+        # Atlanamayan yöntemler son denemesi başarısız olsa da denenir
+        self.assertEqual(cache.plan(["python", "powershell"])[1], [])
+
+    def test_retest_after_seconds(self):
+        cache = self.cache()
+        cache.record("powershell", "failed", 30.0)
+        self.now += Cache.RETEST_SECONDS - 1
+        self.assertEqual(cache.plan(["powershell"], skippable=["powershell"])[1], ["powershell"])
+        self.now += 1
+        self.assertEqual(cache.plan(["powershell"], skippable=["powershell"])[1], [])
+
+    def test_saved_state_survives_reload(self):
+        cache = self.cache()
+        cache.record("powershell", "failed", 30.0)
+        cache.save()
+        reloaded = self.cache()
+        self.assertEqual(reloaded.methods, cache.methods)
+        self.assertEqual(reloaded.plan(["powershell"], skippable=["powershell"])[1], ["powershell"])
+
+    def test_other_host_or_corrupt_file_resets(self):
+        cache = self.cache()
+        cache.record("powershell", "failed", 30.0)
+        cache.save()
+        self.assertEqual(self.cache(host="baska-makine").methods, {})
+        for content in ("{bozuk", "[]", json.dumps({"version": 99, "host": "test", "methods": {"cmd": {}}})):
+            with self.subTest(content=content):
+                with open(self.filename, "w", encoding="utf-8") as f:
+                    f.write(content)
+                self.assertEqual(self.cache().methods, {})
+
+    def test_unchanged_cache_is_not_written(self):
+        cache = self.cache()
+        cache.save()
+        self.assertFalse(os.path.exists(self.filename))
+
+
+class CleanRecycleBinTest(unittest.TestCase):
+    """clean_recycle_bin'in yöntem sırası; komutlar gerçek süreç yerine sahte yürütücüyle çalışır"""
+
+    def setUp(self):
+        self.base = tempfile.mkdtemp(prefix="temizle-methods-run-test-")
+        self.addCleanup(shutil.rmtree, self.base, True)
+        self.filename = os.path.join(self.base, Cache.FILE_NAME)
+        self.root = os.path.join(self.base, "$Recycle.Bin")
+        self.now = 1_700_000_000.0
+
+    def run_once(self, failing=("powershell",), cancel_on=None):
+        """Kutuyu yeniden kur ve temizle; çağrılan komut adlarını ve sonucu döndür"""
+        user = os.path.join(self.root, "S-1-5-21-1000")
+        os.makedirs(user, exist_ok=True)
+        for name in ("$I0.dat", "$R0.docx"):
+            with open(os.path.join(user, name), "wb") as f:
+                f.write(b"x")
+        # Kullanımdaki bir dosya Python yöntemini başarısız kılar; komutlara sıra gelir
+        cleaner = FakeVolumeCleaner([self.root], locked={"$I0.dat"})
+        self.addCleanup(cleaner.reaper.stop)
+        cleaner.recycle_commands = {"powershell": ["powershell-sahte"], "cmd": ["cmd-sahte"]}
+        cache = Cache.load(self.filename, host="test")
+        cache.clock = lambda: self.now
+        cleaner.recycle_method_cache = cache
+        calls = []
+
+        def executor(args, timeout):
+            name = args[0].split("-")[0]
+            calls.append(name)
+            if name == cancel_on:
+                cleaner.cancel()
+                raise subprocess.SubprocessError("İşlem durduruldu")
+            if name in failing:
+                raise subprocess.CalledProcessError(1, args)
+        cleaner.command_executor = executor
+        result = cleaner.run_cleaning(["recycle_bin"])
+        return calls, result["tasks"]["recycle_bin"], cache
+
+    def test_failing_command_skipped_then_cmd_first(self):
+        calls, task, _ = self.run_once()
+        self.assertEqual(calls, ["powershell", "cmd"])
+        self.assertEqual(task["method"], "cmd")
+        for _ in range(3):
+            calls, task, cache = self.run_once()
+            self.assertEqual(calls, ["cmd"])
+            self.assertEqual(task["method"], "cmd")
+        self.assertEqual(cache.methods["powershell"]["skipped"], 3)
+
+    def test_quick_failure_not_retried_inside_window(self):
+        # Tüm yöntemler başarısız olsa da atlanan komutlar pencere içinde yeniden çalıştırılmaz
+        calls, _, _ = self.run_once(failing=("powershell", "cmd"))
+        self.assertEqual(calls, ["powershell", "cmd"])
+        for _ in range(Cache.RETEST_RUNS):
+            calls, _, _ = self.run_once(failing=("powershell", "cmd"))
+            self.assertEqual(calls, [])
+        calls, _, _ = self.run_once(failing=("powershell", "cmd"))
+        self.assertEqual(sorted(calls), ["cmd", "powershell"])
+
+    def test_retested_after_expiry(self):
+        self.run_once(failing=("powershell", "cmd"))
+        self.now += Cache.RETEST_SECONDS
+        calls, _, _ = self.run_once(failing=("powershell", "cmd"))
+        self.assertEqual(sorted(calls), ["cmd", "powershell"])
+
+    def test_cancellation_not_recorded_as_failure(self):
+        calls, _, cache = self.run_once(cancel_on="powershell")
+        self.assertEqual(calls, ["powershell"])
+        self.assertNotIn("powershell", cache.methods)
+        self.assertNotIn("powershell", Cache.load(self.filename, host="test").methods)
+        # Sonraki çalıştırma PowerShell'i atlamaz
+        calls, _, _ = self.run_once()
+        self.assertEqual(calls, ["powershell", "cmd"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+"""Çevrimdışı hive okuyucusunun (RegfRegistryBackend) fikstür hive dosyalarıyla denetimi"""
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import temizle
+from benchmark import build_profile, write_hive
+
+KEY = r"Software\Test"
+SUBKEYS = ["Alfa", "beta", "Gamma", "delta", "Epsilon", "Özel Ayarlar", "Документы", "zeta"]
+BIG = bytes(range(256)) * 160  # iki büyük veri parçası (16344 bayttan büyük)
+
+
+def sample_registry():
+    registry = temizle.MemoryRegistryBackend()
+    for name in SUBKEYS:
+        registry.create_key(f"{KEY}\\{name}")
+    registry.set_value(KEY, "Sayı", 0x12345678, temizle.REG_DWORD)
+    registry.set_value(KEY, "Kısa", "a", temizle.REG_SZ)
+    registry.set_value(KEY, "İkili", b"\x01\x02", temizle.REG_BINARY)
+    registry.set_value(KEY, "Boş", b"", temizle.REG_BINARY)
+    registry.set_value(KEY, "Yol", "%TEMP%\\rapor", temizle.REG_EXPAND_SZ)
+    registry.set_value(KEY, "Liste", ["C:\\bir.docx", "C:\\iki.xlsx"], temizle.REG_MULTI_SZ)
+    registry.set_value(KEY, "Büyük", 2 ** 40 + 7, temizle.REG_QWORD)
+    registry.set_value(KEY, "Blob", BIG, temizle.REG_BINARY)
+    registry.set_value(f"{KEY}\\Документы", "Файл", "отчёт.docx", temizle.REG_SZ)
+    return registry
+
+
+def registry_entries(manifest):
+    return sorted((entry["kind"], entry["path"].lower(), entry.get("name", "").lower())
+                  for entry in manifest.entries if entry["kind"].startswith("registry"))
+
+
+class RegfBackendTest(unittest.TestCase):
+    def setUp(self):
+        self.base = tempfile.mkdtemp(prefix="temizle-regf-test-")
+        self.addCleanup(shutil.rmtree, self.base, True)
+        self.registry = sample_registry()
+
+    def hive(self, name="NTUSER.DAT", **options):
+        filename = os.path.join(self.base, name)
+        write_hive(filename, self.registry, **options)
+        return filename
+
+    def open(self, filename):
+        backend = temizle.RegfRegistryBackend(filename)
+        self.addCleanup(backend.close)
+        return backend
+
+    def assert_same_as_memory(self, backend):
+        for path in [KEY] + [f"{KEY}\\{name}" for name in SUBKEYS]:
+            expected = self.registry.read_key(path)
+            snapshot = backend.read_key(path)
+            self.assertEqual(sorted(snapshot.subkeys), sorted(expected.subkeys), path)
+            self.assertEqual(sorted(snapshot.values), sorted(expected.values), path)
+
+    def test_subkey_list_kinds(self):
+        # list_limit=3: listeler ri altında parçalanır
+        for signature in (b"lh", b"lf", b"li"):
+            for limit in (256, 3):
+                with self.subTest(signature=signature, limit=limit):
+                    filename = self.hive(f"{signature.decode()}{limit}.DAT", list_signature=signature,
+                                         list_limit=limit)
+                    self.assert_same_as_memory(self.open(filename))
+
+    def test_value_decoding(self):
+        values = {name: (data, value_type) for name, data, value_type in
+                  self.open(self.hive()).read_key(KEY).values}
+        self.assertEqual(values["Sayı"], (0x12345678, temizle.REG_DWORD))
+        # "a\0" UTF-16 olarak 4 bayttır ve veri konumu alanında saklanır
+        self.assertEqual(values["Kısa"], ("a", temizle.REG_SZ))
+        self.assertEqual(values["İkili"], (b"\x01\x02", temizle.REG_BINARY))
+        self.assertEqual(values["Boş"], (b"", temizle.REG_BINARY))
+        self.assertEqual(values["Liste"], (["C:\\bir.docx", "C:\\iki.xlsx"], temizle.REG_MULTI_SZ))
+        self.assertEqual(values["Büyük"], (2 ** 40 + 7, temizle.REG_QWORD))
+        self.assertEqual(values["Blob"], (BIG, temizle.REG_BINARY))
+
+    def test_big_data_by_version(self):
+        # 1.4 ve sonrası db hücresi, öncesi tek hücre kullanır
+        for minor_version in (3, 5):
+            with self.subTest(minor_version=minor_version):
+                backend = self.open(self.hive(f"v{minor_version}.DAT", minor_version=minor_version))
+                self.assertEqual(backend.minor_version, minor_version)
+                values = {name: data for name, data, _ in backend.read_key(KEY).values}
+                self.assertEqual(values["Blob"], BIG)
+
+    def test_non_ascii_names_skip_hash(self):
+        backend = self.open(self.hive())
+        self.assertEqual(backend.read_key(f"{KEY}\\ÖZEL AYARLAR").subkeys, [])
+        values = backend.read_key(f"{KEY}\\документы").values
+        self.assertEqual(values, [("Файл", "отчёт.docx", temizle.REG_SZ)])
+        with self.assertRaises(FileNotFoundError):
+            backend.read_key(f"{KEY}\\Yok")
+
+    def test_read_only(self):
+        backend = self.open(self.hive())
+        with self.assertRaises(PermissionError):
+            backend.delete_values(KEY, ["Sayı"])
+        with self.assertRaises(PermissionError):
+            backend.delete_key(f"{KEY}\\Alfa")
+
+    def read_all(self, filename):
+        with temizle.RegfRegistryBackend(filename) as backend:
+            for path in [KEY] + [f"{KEY}\\{name}" for name in SUBKEYS]:
+                backend.read_key(path)
+
+    def test_truncated_hive(self):
+        filename = self.hive()
+        with open(filename, "rb") as f:
+            data = f.read()
+        for length in (0, 100, 4096, 4096 + 40, 4096 + 200, len(data) // 2):
+            with self.subTest(length=length):
+                with open(filename, "wb") as f:
+                    f.write(data[:length])
+                with self.assertRaises(OSError):
+                    self.read_all(filename)
+
+    def test_corrupted_hive(self):
+        # Bozuk veri yalnızca OSError'a yol açabilir; okuma başarılı da olabilir
+        filename = self.hive()
+        with open(filename, "rb") as f:
+            data = f.read()
+        rng = random.Random(1)
+        for trial in range(300):
+            corrupted = bytearray(data)
+            for _ in range(rng.randint(1, 8)):
+                corrupted[rng.randrange(4096, len(data))] = rng.randrange(256)
+            with open(filename, "wb") as f:
+                f.write(corrupted)
+            with self.subTest(trial=trial):
+                try:
+                    self.read_all(filename)
+                except OSError:
+                    pass
+
+    def test_wrong_list_signature(self):
+        filename = self.hive()
+        with open(filename, "rb") as f:
+            data = bytearray(f.read())
+        position = data.index(b"lh", 4096)
+        data[position:position + 2] = b"zz"
+        with open(filename, "wb") as f:
+            f.write(data)
+        with self.assertRaises(OSError):
+            self.read_all(filename)
+
+    def test_manifest_matches_memory_scan(self):
+        fixture = build_profile(self.base, files=10, size=16, depth=1, values=200)
+        hive = os.path.join(self.base, "profil.DAT")
+        write_hive(hive, temizle.MemoryRegistryBackend.from_json(fixture["registry"]))
+        manifests = []
+        for backend in (temizle.MemoryRegistryBackend.from_json(fixture["registry"]),
+                        temizle.RegfRegistryBackend(hive)):
+            cleaner = temizle.OfficeCleaner(environ=fixture["environ"], registry_backend=backend)
+            self.addCleanup(cleaner.reaper.stop)
+            cleaner.run_cleaning(["office_history"], dry_run=True)
+            manifests.append(registry_entries(cleaner.manifest))
+        backend.close()
+        self.assertTrue(manifests[0])
+        self.assertEqual(manifests[0], manifests[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+"""Önbellek katmanının paylaşılan Office anahtarlarını çalıştırma başına bir kez okuttuğunu denetler"""
+import collections
+import unittest
+
+import temizle
+
+OFFICE = r"Software\Microsoft\Office"
+SHARED_KEYS = [r"Common\Internet", r"Common\Roaming", r"Common\Identity", r"Common\General"]
+
+
+def office_fixture():
+    """Birkaç sürüm ve uygulamadan, paylaşılan Common anahtarları da içeren sahte registry"""
+    keys = {}
+    for version in ("14.0", "15.0", "16.0"):
+        for app, extension in (("Word", ".docx"), ("Excel", ".xlsx"), ("PowerPoint", ".pptx"),
+                               ("Access", ".accdb"), ("Visio", ".vsdx")):
+            for key in ("File MRU", "User MRU", "Recent Files"):
+                keys[rf"{OFFICE}\{version}\{app}\{key}"] = {
+                    "Max Display": 25,
+                    "Item 1": rf"[F00000000][T01D000000000001]*C:\Belgeler\rapor{extension}",
+                }
+        common = rf"{OFFICE}\{version}\Common"
+        keys[common + r"\Internet"] = {"sharepoint": "https://contoso.sharepoint.com/sites/ekip"}
+        keys[common + r"\Roaming\Identities\0A1B"] = {"onedrive": "https://onedrive.live.com/"}
+        keys[common + r"\Identity"] = {"graph": "https://graph.microsoft.com/v1.0/me"}
+        keys[common + r"\General"] = {"RecentFiles": r"C:\Belgeler\rapor.docx"}
+    keys[r"Software\Microsoft\OneDrive"] = {"cache": "https://onedrive.live.com/"}
+    return keys
+
+
+class CountingRegistryBackend(temizle.MemoryRegistryBackend):
+    """Her anahtarın kaç kez açılıp listelendiğini yol başına sayan bellek içi registry"""
+
+    def __init__(self, keys=None):
+        super().__init__(keys)
+        self.opens = collections.Counter()
+        self.enums = collections.Counter()
+
+    def read_key(self, path):
+        key = self._norm(path)
+        self.opens[key] += 1
+        snapshot = super().read_key(path)
+        self.enums[key] += 1
+        return snapshot
+
+
+class RegistryReadCountTest(unittest.TestCase):
+    def setUp(self):
+        self.backend = CountingRegistryBackend(office_fixture())
+        self.cleaner = temizle.OfficeCleaner(environ={}, registry_backend=self.backend)
+        self.addCleanup(self.cleaner.reaper.stop)
+
+    def assert_read_once(self):
+        opens, enums = self.backend.opens, self.backend.enums
+        # Katalog bu anahtarları 16.0 ve sonrası için tanımlar; Excel, Word ve Office 365 kuralları paylaşır
+        for key in SHARED_KEYS:
+            path = rf"{OFFICE}\16.0\{key}".lower()
+            with self.subTest(key=path):
+                self.assertEqual((opens[path], enums[path]), (1, 1))
+        # Hiçbir anahtar (var olmayanlar dahil) iki kez açılmaz
+        self.assertEqual(max(opens.values()), 1)
+
+    def test_office_history_run(self):
+        for dry_run in (True, False):
+            with self.subTest(dry_run=dry_run):
+                self.backend.opens.clear()
+                self.backend.enums.clear()
+                results = self.cleaner.run_cleaning(["office_history"], dry_run=dry_run)
+                self.assertEqual(results["tasks"]["office_history"]["status"], "ok")
+                self.assert_read_once()
+        # Gerçek çalıştırma paylaşılan anahtarlardaki bulut kayıtlarını da sildi
+        self.assertFalse(self.backend.key_exists(rf"{OFFICE}\16.0\Common\Roaming\Identities"))
+        self.assertEqual(self.backend.values(rf"{OFFICE}\16.0\Common\Internet"), [])
+
+    def test_every_office_cleaner_in_one_run(self):
+        # Uygulamaya özel temizleyiciler ve tüm katalog kuralları aynı çalıştırmanın önbelleğini paylaşır
+        cleaner = self.cleaner
+        cleaner.registry = temizle.CachingRegistryBackend(self.backend)
+        cleaner.office_index = None
+        cleaner.is_cleaning = True
+        cleaner.clean_excel_recent_files(scan_files=False)
+        cleaner.clean_word_recent_files(scan_files=False)
+        cleaner.clean_office365_cloud_history(scan_files=False)
+        for rule in cleaner.catalog.registry_rules:
+            cleaner.run_registry_rule(rule["name"])
+        cleaner.is_cleaning = False
+        self.assert_read_once()
+
+
+class RegistryBackendInterfaceTest(unittest.TestCase):
+    def test_incomplete_backend_fails_on_creation(self):
+        class ReadOnlyBackend(temizle.RegistryBackend):
+            def read_key(self, path):
+                raise FileNotFoundError(path)
+
+        # Eksik arka uç temizlik ortasında değil, oluşturulurken hata verir
+        with self.assertRaises(TypeError):
+            ReadOnlyBackend()
+
+
+class RegistryRuleScopeTest(unittest.TestCase):
+    """Geçmiş kuralları MRU anahtarlarında yalnızca son kullanılanlar kayıtlarını siler"""
+
+    def setUp(self):
+        def mru(app):
+            return rf"{OFFICE}\16.0\{app}\File MRU"
+
+        self.backend = temizle.MemoryRegistryBackend({
+            mru("PowerPoint"): {
+                "Item 1": r"[F00000000][T01D000000000001]*C:\Belgeler\sunum.pptx",
+                "Item 2": r"C:\Belgeler\notlar.txt",
+                "Max Display": 25,
+            },
+            mru("Access"): {
+                "Item 1": r"[F00000000][T01D000000000001]*C:\Belgeler\veri.accdb",
+                "Max Display": 25,
+            },
+            mru("Visio"): {
+                "Item 1": r"[F00000000][T01D000000000001]*C:\Belgeler\cizim.vsdx",
+                "Max Display": 25,
+            },
+            rf"{OFFICE}\16.0\Visio\Options": {"Item 1": "ayar"},
+        })
+        self.cleaner = temizle.OfficeCleaner(environ={}, registry_backend=self.backend)
+        self.addCleanup(self.cleaner.reaper.stop)
+        self.cleaner.run_cleaning(["office_history"])
+
+    def remaining(self, app, key="File MRU"):
+        return sorted(name for name, _, _ in self.backend.values(rf"{OFFICE}\16.0\{app}\{key}"))
+
+    def test_catalog_apps_keep_non_mru_values(self):
+        # PowerPoint ve Access yalnızca ad anahtar kelimeleri ve veri uzantılarıyla eşleşir
+        self.assertEqual(self.remaining("PowerPoint"), ["Item 2", "Max Display"])
+        self.assertEqual(self.remaining("Access"), ["Max Display"])
+
+    def test_discovered_apps_delete_only_items(self):
+        # Keşfedilen uygulamaların MRU anahtarlarında her "Item " değeri silinir, diğerleri kalır
+        self.assertEqual(self.remaining("Visio"), ["Max Display"])
+        self.assertEqual(self.remaining("Visio", "Options"), ["Item 1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
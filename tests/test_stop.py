@@ -0,0 +1,151 @@
+"""Durdurmanın büyük sahte ağaçta sabit bir süre içinde etkili olduğunu denetler"""
+import itertools
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+import temizle
+
+# Durdurma isteğinden döngünün/silicinin çıkmasına kadar kabul edilen en uzun süre (sn)
+STOP_BOUND_SECONDS = 1.0
+TREE_DIRS = 200
+FILES_PER_DIR = 100
+# Bu kadar dosya silindikten (ya da okunduktan) sonra durdurulur
+STOP_AFTER = 1000
+
+
+def build_tree(base, dirs=TREE_DIRS, files=FILES_PER_DIR):
+    """İki seviyeli klasörlerde 1 baytlık dosyalardan ağaç kur; dosya sayısını döndür"""
+    for index in range(dirs):
+        directory = os.path.join(base, f"grup{index // 20}", f"klasor{index}")
+        os.makedirs(directory)
+        for number in range(files):
+            with open(os.path.join(directory, f"dosya{number}.tmp"), "wb") as handle:
+                handle.write(b"x")
+    return dirs * files
+
+
+def count_files(root):
+    return sum(len(names) for _, _, names in os.walk(root))
+
+
+class StopTest(unittest.TestCase):
+    def setUp(self):
+        self.base = tempfile.mkdtemp(prefix="temizle-stop-test-")
+        self.addCleanup(shutil.rmtree, self.base, True)
+        self.total = build_tree(self.base)
+
+    def stop_after(self, count, cancel):
+        """count. çağrıda cancel'ı çağıran ve durdurma anını kaydeden sayaç döndür"""
+        counter = itertools.count(1)
+        stopped = []
+
+        def tick():
+            if next(counter) == count:
+                stopped.append(time.perf_counter())
+                cancel()
+        return tick, stopped
+
+    def cleaner(self):
+        cleaner = temizle.OfficeCleaner(environ={"TEMP": self.base},
+                                        registry_backend=temizle.MemoryRegistryBackend())
+        self.addCleanup(cleaner.reaper.stop)
+        self.addCleanup(cleaner.tree_deleter.shutdown)
+        cleaner.is_cleaning = True
+        return cleaner
+
+    def assert_stopped_in_time(self, stopped, finished):
+        self.assertEqual(len(stopped), 1, "durdurma noktasına ulaşılmadı")
+        self.assertLess(finished - stopped[0], STOP_BOUND_SECONDS)
+        self.assertGreater(count_files(self.base), 0, "durdurmaya rağmen her şey silindi")
+
+    def test_tree_deleter(self):
+        token = temizle.CancelToken()
+        tick, stopped = self.stop_after(STOP_AFTER, token.cancel)
+
+        def remove_file(path, entry):
+            os.remove(path)
+            tick()
+
+        deleter = temizle.ParallelTreeDeleter(max_workers=8)
+        self.addCleanup(deleter.shutdown)
+        result = deleter.delete(self.base, remove_file=remove_file,
+                                should_continue=lambda: not token.cancelled)
+        self.assert_stopped_in_time(stopped, time.perf_counter())
+        self.assertTrue(result["cancelled"])
+        self.assertLess(result["files"], self.total)
+
+    def test_walk_files(self):
+        token = temizle.CancelToken()
+        tick, stopped = self.stop_after(STOP_AFTER, token.cancel)
+        after_stop = 0
+        for _entry, _stat in temizle.walk_files(self.base, lambda: not token.cancelled):
+            if stopped:
+                after_stop += 1
+            tick()
+        self.assert_stopped_in_time(stopped, time.perf_counter())
+        # Durdurma klasör sınırında denetlenir: en fazla o anki klasörün kalanı okunur
+        self.assertLessEqual(after_stop, FILES_PER_DIR)
+
+    def run_temp_policy(self, max_age_hours, quota_bytes):
+        cleaner = self.cleaner()
+        cleaner.temp_max_age_hours = max_age_hours
+        cleaner.temp_quota_bytes = quota_bytes
+        cleaner.TEMP_QUOTA_GRACE_SECONDS = -3600
+        tick, stopped = self.stop_after(STOP_AFTER, cleaner.cancel)
+
+        def remove_file(path, entry=None, dry_run=None):
+            temizle.OfficeCleaner.remove_file(cleaner, path, entry, dry_run)
+            tick()
+
+        cleaner.remove_file = remove_file
+        counts = cleaner.clean_temp_dir_with_policy(self.base)
+        self.assert_stopped_in_time(stopped, time.perf_counter())
+        self.assertLess(counts["deleted"], self.total)
+
+    def test_interrupt_during_reaper_wait(self):
+        # Temizlik bitmiş, süreç arka plan silmesini beklerken Ctrl+C gelir (run_headless'in sonu)
+        cleaner = self.cleaner()
+        cleaner.is_cleaning = False
+        tick, stopped = self.stop_after(STOP_AFTER, cleaner.interrupt)
+
+        def remove_file(path, entry):
+            os.remove(path)
+            tick()
+
+        for name in sorted(os.listdir(self.base)):
+            cleaner.reaper.bury(os.path.join(self.base, name), remove_file=remove_file)
+        self.assertTrue(cleaner.reaper.wait(timeout=60))
+        self.assert_stopped_in_time(stopped, time.perf_counter())
+        # Kalan mezar taşları sonraki açılışta devralınmak üzere yerinde durur
+        self.assertTrue(temizle.TombstoneReaper.find_leftovers([self.base]))
+
+    def test_temp_age_pass(self):
+        # Yaş sınırı 0: her dosya ilk geçişte silinmeye aday
+        self.run_temp_policy(max_age_hours=0, quota_bytes=None)
+
+    def test_temp_quota_pass(self):
+        # Kota 0: her dosya en eskiden başlayarak ikinci geçişte silinmeye aday
+        self.run_temp_policy(max_age_hours=None, quota_bytes=0)
+
+
+class CommandStopTest(unittest.TestCase):
+    def test_run_command(self):
+        cleaner = temizle.OfficeCleaner(environ={}, registry_backend=temizle.MemoryRegistryBackend())
+        self.addCleanup(cleaner.reaper.stop)
+        cleaner.is_cleaning = True
+        delay = 0.2
+        threading.Timer(delay, cleaner.cancel).start()
+        started = time.perf_counter()
+        with self.assertRaises(subprocess.SubprocessError):
+            cleaner.run_command([sys.executable, "-c", "import time; time.sleep(30)"], timeout=30)
+        self.assertLess(time.perf_counter() - started - delay, STOP_BOUND_SECONDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+"""Temp yaş/kota politikası: sınırlı yığınla seçim, önizleme ile gerçek çalıştırmanın aynı dosyaları seçmesi"""
+import os
+import random
+import shutil
+import tempfile
+import time
+import unittest
+
+import temizle
+
+HOUR = 3600
+
+
+class OldestFirstSelectorTest(unittest.TestCase):
+    def test_heap_bounded_by_entry_count(self):
+        rng = random.Random(3)
+        files = [(rng.uniform(0, 1000), 10, f"dosya{index}") for index in range(5000)]
+        selector = temizle.OldestFirstSelector(excess=10**9, limit=50)
+        for timestamp, size, path in files:
+            selector.add(timestamp, size, path)
+            self.assertLessEqual(len(selector), 50)
+        self.assertEqual(selector.oldest_first(), sorted(files)[:50])
+
+    def test_rounds_continue_after_last_selected(self):
+        # Aynı zamanlı dosyalar yola göre sıralanır; turlar arasında hiçbiri atlanmaz veya tekrarlanmaz
+        files = [(float(index // 7), 1, f"d{index % 7}") for index in range(70)]
+        expected = sorted(files, key=lambda item: (item[0], item[2]))
+        selected, after = [], None
+        while True:
+            selector = temizle.OldestFirstSelector(excess=10**9, limit=8, after=after)
+            for timestamp, size, path in reversed(files):
+                selector.add(timestamp, size, path)
+            batch = selector.oldest_first()
+            if not batch:
+                break
+            selected.extend(batch)
+            after = (batch[-1][0], batch[-1][2])
+        self.assertEqual(selected, expected)
+
+    def test_keeps_only_what_covers_excess(self):
+        selector = temizle.OldestFirstSelector(excess=25, limit=100)
+        for index in range(100):
+            selector.add(float(index), 10, f"dosya{index:03d}")
+        self.assertEqual([path for _, _, path in selector.oldest_first()], ["dosya000", "dosya001", "dosya002"])
+
+
+class LockingCleaner(temizle.OfficeCleaner):
+    """Bazı dosyaları kullanımdaymış gibi silemeyen temizleyici"""
+
+    def __init__(self, locked, **kwargs):
+        super().__init__(**kwargs)
+        self.locked = locked
+        self.attempts = {}
+
+    def remove_file(self, path, entry=None, dry_run=None):
+        if path in self.locked and not (self.dry_run if dry_run is None else dry_run):
+            self.attempts[path] = self.attempts.get(path, 0) + 1
+            raise PermissionError(13, "dosya başka bir işlem tarafından kullanılıyor", path)
+        return super().remove_file(path, entry, dry_run)
+
+
+class TempPolicyTest(unittest.TestCase):
+    def setUp(self):
+        base = tempfile.mkdtemp(prefix="temizle-temp-test-")
+        self.addCleanup(shutil.rmtree, base, True)
+        self.temp_dir = os.path.join(base, "Temp")
+        rng = random.Random(11)
+        now = time.time()
+        self.planted = {}
+        for index in range(400):
+            directory = os.path.join(self.temp_dir, f"kurulum{index % 5}") if index % 2 else self.temp_dir
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"tmp{index}.tmp")
+            size = rng.randint(10, 100)
+            with open(path, "wb") as f:
+                f.write(b"x" * size)
+            # İlk yirmi dosya son yarım saatte oluşmuş; diğerleri 2-48 saat önce
+            stamp = now - (rng.uniform(0, HOUR / 2) if index < 20 else rng.uniform(2 * HOUR, 48 * HOUR))
+            os.utime(path, (stamp, stamp))
+            self.planted[path] = (stamp, size)
+
+    def cleaner(self, locked=()):
+        cleaner = LockingCleaner(set(locked), environ={"TEMP": self.temp_dir},
+                                 registry_backend=temizle.MemoryRegistryBackend())
+        self.addCleanup(cleaner.reaper.stop)
+        cleaner.temp_max_age_hours = 36
+        cleaner.temp_quota_bytes = 3000
+        # Küçük yığın: kota geçişi birçok tura bölünür
+        cleaner.TEMP_QUOTA_BATCH = 16
+        return cleaner
+
+    def remaining(self):
+        return {os.path.join(directory, name) for directory, _, names in os.walk(self.temp_dir) for name in names}
+
+    def test_preview_selects_what_a_real_run_deletes(self):
+        preview = self.cleaner()
+        results = preview.run_cleaning(["temp_files"], dry_run=True)
+        previewed = {entry["path"] for entry in preview.manifest.entries}
+        self.assertEqual(self.remaining(), set(self.planted))
+        self.assertEqual(results["tasks"]["temp_files"]["files"], len(previewed))
+
+        self.cleaner().run_cleaning(["temp_files"])
+        remaining = self.remaining()
+        self.assertEqual(set(self.planted) - remaining, previewed)
+        self.assertLessEqual(sum(self.planted[path][1] for path in remaining), 3000)
+
+    def test_locked_files_tried_once(self):
+        locked = {path for index, path in enumerate(self.planted) if index % 37 == 5}
+        cleaner = self.cleaner(locked)
+        results = cleaner.run_cleaning(["temp_files"])
+        remaining = self.remaining()
+        self.assertTrue(locked <= remaining)
+        # Son bir saatteki kilitli dosyalara kota hiç dokunmaz
+        self.assertTrue(cleaner.attempts)
+        self.assertLessEqual(set(cleaner.attempts), locked)
+        self.assertTrue(all(count == 1 for count in cleaner.attempts.values()))
+        self.assertEqual(results["tasks"]["temp_files"]["locked"], len(cleaner.attempts))
+        # Kilitli dosyaların yerine daha yeni dosyalar silinerek yine kota altına inilir
+        self.assertLessEqual(sum(self.planted[path][1] for path in remaining - locked), 3000)
+
+    def test_oldest_deleted_first_and_recent_kept(self):
+        cleaner = self.cleaner()
+        cleaner.temp_max_age_hours = None
+        cleaner.run_cleaning(["temp_files"])
+        remaining = self.remaining()
+        deleted = [self.planted[path][0] for path in set(self.planted) - remaining]
+        kept_old = [self.planted[path][0] for path in remaining if self.planted[path][0] < time.time() - HOUR]
+        self.assertTrue(deleted)
+        self.assertLessEqual(max(deleted), min(kept_old))
+        self.assertTrue(all(path in remaining for path in list(self.planted)[:20]))
+        self.assertLessEqual(sum(self.planted[path][1] for path in remaining), 3000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""Mezar taşı silicisi: arka planda silme, yarıda kalan silmenin sonraki açılışta tamamlanması"""
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+import temizle
+
+TIMEOUT = 5.0
+DIRS = 10
+FILES_PER_DIR = 20
+# Bu kadar dosya silindikten sonra çalıştırma "kesilir"
+STOP_AFTER = 30
+
+
+def build_cache(root):
+    for index in range(DIRS):
+        directory = os.path.join(root, f"klasor{index}")
+        os.makedirs(directory)
+        for number in range(FILES_PER_DIR):
+            with open(os.path.join(directory, f"dosya{number}.tmp"), "wb") as f:
+                f.write(b"x")
+
+
+def count_files(root):
+    return sum(len(names) for _, _, names in os.walk(root))
+
+
+class InterruptedCleaner(temizle.OfficeCleaner):
+    """STOP_AFTER dosyadan sonra arka plan silicisini durduran temizleyici (süreç sonlanmış gibi)"""
+
+    def __init__(self, **options):
+        self.removed = 0
+        super().__init__(**options)
+
+    def remove_file(self, path, entry=None, dry_run=None):
+        super().remove_file(path, entry, dry_run)
+        self.removed += 1
+        if self.removed == STOP_AFTER:
+            self.reaper.stop()
+
+
+class TombstoneTest(unittest.TestCase):
+    def setUp(self):
+        self.base = tempfile.mkdtemp(prefix="temizle-tombstone-test-")
+        self.addCleanup(shutil.rmtree, self.base, True)
+        self.environ = {"LOCALAPPDATA": os.path.join(self.base, "Local"),
+                        "APPDATA": os.path.join(self.base, "Roaming")}
+        self.cache = os.path.join(self.environ["LOCALAPPDATA"], "Google", "Chrome", "User Data", "Default",
+                                  "Cache")
+        build_cache(self.cache)
+        self.parent = os.path.dirname(self.cache)
+
+    def cleaner(self, cls=temizle.OfficeCleaner):
+        cleaner = cls(environ=self.environ, registry_backend=temizle.MemoryRegistryBackend())
+        self.addCleanup(cleaner.reaper.stop)
+        return cleaner
+
+    def test_bury_then_background_delete(self):
+        cleaner = self.cleaner()
+        cleaner.is_cleaning = True
+        cleaner.bury_tree(self.cache)
+        # Klasör hemen yerinden kalkar, içeriği arka planda silinir
+        self.assertFalse(os.path.exists(self.cache))
+        self.assertTrue(cleaner.reaper.wait(TIMEOUT))
+        self.assertEqual(cleaner.reaper.find_leftovers([self.parent]), [])
+
+    def test_resume_after_interruption(self):
+        first = self.cleaner(InterruptedCleaner)
+        first.is_cleaning = True
+        first.bury_tree(self.cache)
+        self.assertTrue(first.reaper.wait(TIMEOUT))
+        leftovers = first.reaper.find_leftovers([self.parent])
+        self.assertEqual(len(leftovers), 1)
+        self.assertEqual(count_files(leftovers[0]), DIRS * FILES_PER_DIR - STOP_AFTER)
+
+        # Sonraki açılış kalan mezar taşını bulur ve silmeyi tamamlar
+        second = self.cleaner()
+        self.assertTrue(second.reaper.wait(TIMEOUT))
+        self.assertFalse(os.path.exists(leftovers[0]))
+        self.assertEqual(second.reaper.find_leftovers([self.parent]), [])
+
+    def test_wait_timeout_and_wakeup(self):
+        release = threading.Event()
+        reaper = temizle.TombstoneReaper()
+        self.addCleanup(reaper.stop)
+
+        def remove_file(path, entry):
+            release.wait(TIMEOUT)
+            os.remove(path)
+
+        reaper.bury(self.cache, remove_file)
+        self.assertFalse(reaper.wait(0.05))
+        release.set()
+        started = time.monotonic()
+        self.assertTrue(reaper.wait())
+        # Bekleyiş dilimin sonunu değil, kuyruğun boşalmasını bekler
+        self.assertLess(time.monotonic() - started, reaper.WAIT_SLICE)
+        self.assertEqual(reaper.pending, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+"""İzleme sayaçlarının olağan bir çalıştırmada dolduğunu denetler"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import temizle
+
+FILES = 10
+
+
+class TraceCounterTest(unittest.TestCase):
+    def setUp(self):
+        self.temp = tempfile.mkdtemp(prefix="temizle-trace-test-")
+        self.addCleanup(shutil.rmtree, self.temp, True)
+        os.makedirs(os.path.join(self.temp, "alt"))
+        for number in range(FILES):
+            folder = self.temp if number % 2 else os.path.join(self.temp, "alt")
+            with open(os.path.join(folder, f"dosya{number}.tmp"), "wb") as handle:
+                handle.write(b"x")
+
+    def run_temp_files(self, max_age_hours=None):
+        cleaner = temizle.OfficeCleaner(environ={"TEMP": self.temp},
+                                        registry_backend=temizle.MemoryRegistryBackend())
+        self.addCleanup(cleaner.reaper.stop)
+        cleaner.tracer = temizle.TraceRecorder()
+        cleaner.temp_max_age_hours = max_age_hours
+        cleaner.run_cleaning(["temp_files"])
+        return cleaner.tracer.counters
+
+    def test_stats_counted_in_normal_walk(self):
+        # Dosyaların boyutu tarama sırasındaki DirEntry.stat'tan alınır; bunlar da sayılır
+        counters = self.run_temp_files()
+        self.assertEqual(counters["unlinks"], FILES)
+        self.assertEqual(counters["stats"], FILES)
+
+    def test_stats_counted_in_policy_walk(self):
+        # Yaş politikası her dosyayı akışta bir kez okur, silerken bir kez daha
+        counters = self.run_temp_files(max_age_hours=0)
+        self.assertEqual(counters["unlinks"], FILES)
+        self.assertEqual(counters["stats"], 2 * FILES)
+
+
+if __name__ == "__main__":
+    unittest.main()
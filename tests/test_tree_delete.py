@@ -0,0 +1,79 @@
+"""ParallelTreeDeleter'ın küçük ağaçlarda havuzsuz, büyüklerde havuzla eksiksiz sildiğini denetler"""
+import os
+import shutil
+import tempfile
+import unittest
+
+import temizle
+
+TREE_DIRS = 12
+FILES_PER_DIR = 30
+
+
+def build_tree(root):
+    """İki seviyeli klasörlerde 1 baytlık dosyalardan ağaç kur; (dosya, klasör) sayısını döndür"""
+    for index in range(TREE_DIRS):
+        directory = os.path.join(root, f"grup{index // 4}", f"klasor{index}")
+        os.makedirs(directory)
+        for number in range(FILES_PER_DIR):
+            with open(os.path.join(directory, f"dosya{number}.tmp"), "wb") as handle:
+                handle.write(b"x")
+    # kök + grup klasörleri + yaprak klasörler
+    return TREE_DIRS * FILES_PER_DIR, 1 + TREE_DIRS // 4 + TREE_DIRS
+
+
+class TreeDeleteTest(unittest.TestCase):
+    def setUp(self):
+        self.base = tempfile.mkdtemp(prefix="temizle-tree-test-")
+        self.addCleanup(shutil.rmtree, self.base, True)
+        self.root = os.path.join(self.base, "Cache")
+        self.files, self.dirs = build_tree(self.root)
+
+    def delete(self, max_workers, parallel_min_files):
+        deleter = temizle.ParallelTreeDeleter(max_workers=max_workers)
+        deleter.PARALLEL_MIN_FILES = parallel_min_files
+        self.addCleanup(deleter.shutdown)
+        result = deleter.delete(self.root)
+        self.assertFalse(os.path.exists(self.root))
+        self.assertEqual((result["files"], result["dirs"], result["errors"]), (self.files, self.dirs, 0))
+        return deleter
+
+    def test_small_tree_skips_pool(self):
+        deleter = self.delete(max_workers=8, parallel_min_files=self.files + 1)
+        self.assertIsNone(deleter._executor)
+
+    def test_large_tree_uses_pool(self):
+        deleter = self.delete(max_workers=8, parallel_min_files=0)
+        self.assertIsNotNone(deleter._executor)
+
+    def test_switches_to_pool_mid_tree(self):
+        # Eşik ilk birkaç klasörden sonra aşılır; sıradaki işler havuza devredilir
+        deleter = self.delete(max_workers=8, parallel_min_files=FILES_PER_DIR * 2)
+        self.assertIsNotNone(deleter._executor)
+
+    def test_single_worker_never_starts_pool(self):
+        deleter = self.delete(max_workers=1, parallel_min_files=0)
+        self.assertIsNone(deleter._executor)
+
+    def test_stop_on_pool_path(self):
+        deleter = temizle.ParallelTreeDeleter(max_workers=8)
+        deleter.PARALLEL_MIN_FILES = 0
+        self.addCleanup(deleter.shutdown)
+        token = temizle.CancelToken()
+        removed = []
+
+        def remove_file(path, entry):
+            os.remove(path)
+            removed.append(path)
+            if len(removed) == FILES_PER_DIR:
+                token.cancel()
+
+        result = deleter.delete(self.root, remove_file=remove_file,
+                                should_continue=lambda: not token.cancelled)
+        self.assertTrue(result["cancelled"])
+        self.assertLess(result["files"], self.files)
+        self.assertTrue(os.path.isdir(self.root))
+
+
+if __name__ == "__main__":
+    unittest.main()
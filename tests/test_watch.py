@@ -0,0 +1,194 @@
+"""İzleme modu: bildirim ve yoklama arka uçları, patlama halindeki olayların tek partide işlenmesi"""
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+import temizle
+from benchmark import build_profile
+
+TIMEOUT = 5.0
+
+
+def make_inotify_watcher():
+    if not sys.platform.startswith("linux"):
+        raise unittest.SkipTest("inotify yalnızca Linux'ta var")
+    try:
+        return temizle.InotifyWatcher()
+    except (OSError, AttributeError) as e:
+        raise unittest.SkipTest(f"inotify kurulamadı: {e}")
+
+
+def plant(directory, name):
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, name)
+    with open(path, "wb") as f:
+        f.write(b"{}")
+    return path
+
+
+class ScriptedWatcher(temizle.DirectoryWatcher):
+    """Her wait çağrısında sıradaki olay listesini döndürür; liste bitince temizleyiciyi durdurur"""
+
+    name = "script"
+
+    def __init__(self, cleaner, script):
+        super().__init__()
+        self.cleaner = cleaner
+        self.script = list(script)
+        self.timeouts = []
+
+    def wait(self, timeout=None):
+        self.timeouts.append(timeout)
+        if not self.script:
+            self.cleaner.cancel()
+            return []
+        return list(self.script.pop(0))
+
+
+class WatchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.base = tempfile.mkdtemp(prefix="temizle-watch-test-")
+        self.addCleanup(shutil.rmtree, self.base, True)
+        fixture = build_profile(self.base, files=20, size=16, depth=1, values=0)
+        self.cleaner = temizle.OfficeCleaner(environ=fixture["environ"],
+                                             registry_backend=temizle.MemoryRegistryBackend())
+        self.cleaner.background_delete = False
+        self.addCleanup(self.cleaner.reaper.stop)
+        self.wef = os.path.join(fixture["environ"]["LOCALAPPDATA"], "Microsoft", "Office", "16.0", "Wef")
+
+
+class RunWatchTest(WatchTestCase):
+    def watch_and_plant(self, watcher, targets):
+        """İzlemeyi arka planda başlat, dosyaları oluştur ve silinmelerini bekle; run_watch sonucunu döndür"""
+        watching = threading.Event()
+        self.cleaner.log_handler = lambda message, level: "izleniyor" in message and watching.set()
+        outcome = {}
+        worker = threading.Thread(target=lambda: outcome.update(
+            self.cleaner.run_watch(watcher, debounce=0.05, max_delay=0.5)))
+        worker.start()
+        try:
+            self.assertTrue(watching.wait(TIMEOUT))
+            planted = [plant(directory, name) for directory, name in targets]
+            deadline = time.monotonic() + TIMEOUT
+            while any(os.path.exists(path) for path in planted) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual([path for path in planted if os.path.exists(path)], [])
+        finally:
+            self.cleaner.cancel()
+            worker.join(TIMEOUT)
+        self.assertFalse(worker.is_alive())
+        return outcome
+
+    def test_inotify_removes_new_file(self):
+        outcome = self.watch_and_plant(make_inotify_watcher(), [(self.wef, "recent_yeni.json")])
+        self.assertEqual(outcome["watch"], "inotify")
+        self.assertTrue(outcome["cancelled"])
+        self.assertGreaterEqual(outcome["batches"], 1)
+
+    def test_inotify_new_subdirectory(self):
+        # Alt dizin ve içindeki dosya, dizinin izlemesi kurulmadan önce oluşur
+        outcome = self.watch_and_plant(make_inotify_watcher(),
+                                       [(os.path.join(self.wef, "yeni", "alt"), "recent_alt.json")])
+        self.assertGreaterEqual(outcome["batches"], 1)
+
+    def test_polling_new_subdirectory(self):
+        outcome = self.watch_and_plant(temizle.PollingWatcher(0.05),
+                                       [(os.path.join(self.wef, "yeni"), "recent_yoklama.json")])
+        self.assertEqual(outcome["watch"], "poll")
+
+    def test_burst_merged_into_one_batch(self):
+        planted = [plant(self.wef, f"recent_{index}.json") for index in range(3)]
+        # Boşta bekleyişte bir olay, ardından debounce içinde iki olay daha, sonra sessizlik
+        watcher = ScriptedWatcher(self.cleaner, [[(self.wef, False)], [(self.wef, False)],
+                                                 [(self.wef, False)], []])
+        self.cleaner.run_scan_rules = self.count_scans(self.cleaner.run_scan_rules)
+        outcome = self.cleaner.run_watch(watcher, debounce=0.05, max_delay=60.0)
+        self.assertEqual((outcome["batches"], outcome["events"]), (1, 3))
+        # İlk tam tarama + partinin tek yeniden okuması
+        self.assertEqual(len(self.scans), 2)
+        self.assertEqual(self.scans[1], [(self.wef, False)])
+        self.assertEqual(watcher.timeouts[1:4], [0.05, 0.05, 0.05])
+        self.assertEqual([path for path in planted if os.path.exists(path)], [])
+
+    def test_separate_bursts(self):
+        watcher = ScriptedWatcher(self.cleaner, [[(self.wef, False)], [], [(self.wef, False)], []])
+        outcome = self.cleaner.run_watch(watcher, debounce=0.05, max_delay=60.0)
+        self.assertEqual((outcome["batches"], outcome["events"]), (2, 2))
+
+    def count_scans(self, run_scan_rules):
+        self.scans = []
+
+        def counted(rules, paths=None, **options):
+            self.scans.append(paths)
+            return run_scan_rules(rules, paths=paths, **options)
+        return counted
+
+
+class WatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="temizle-watcher-test-")
+        self.addCleanup(shutil.rmtree, self.root, True)
+
+    def assert_interrupt_ends_wait(self, watcher):
+        self.addCleanup(watcher.close)
+        watcher.add(self.root, True)
+        outcome = []
+        worker = threading.Thread(target=lambda: outcome.append(watcher.wait()))
+        worker.start()
+        time.sleep(0.05)
+        started = time.monotonic()
+        watcher.interrupt()
+        worker.join(TIMEOUT)
+        self.assertFalse(worker.is_alive())
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(outcome, [[]])
+
+    def test_incomplete_watcher_fails_on_creation(self):
+        class NoWaitWatcher(temizle.DirectoryWatcher):
+            name = "eksik"
+
+        with self.assertRaises(TypeError):
+            NoWaitWatcher()
+
+    def test_polling_interrupt(self):
+        self.assert_interrupt_ends_wait(temizle.PollingWatcher(3600.0))
+
+    def test_inotify_interrupt(self):
+        self.assert_interrupt_ends_wait(make_inotify_watcher())
+
+    def test_polling_interval_with_clock(self):
+        now = [100.0]
+        watcher = temizle.PollingWatcher(10.0, clock=lambda: now[0])
+        watcher.add(self.root, True)
+        # Aralık dolmadan zaman aşımı boş döner
+        self.assertEqual(watcher.wait(0.01), [])
+        now[0] += 10.0
+        self.assertEqual(watcher.wait(0.01), [(self.root, True)])
+        self.assertEqual(watcher.wait(0.01), [])
+        now[0] += 10.0
+        self.assertEqual(watcher.wait(), [(self.root, True)])
+
+    def test_polling_detects_new_subdirectory(self):
+        now = [0.0]
+        watcher = temizle.PollingWatcher(1.0, clock=lambda: now[0])
+        watcher.add(self.root, True)
+        planner = temizle.ScanPlanner([temizle.ScanRule("test", [self.root], keywords=("recent",))])
+        seen = []
+
+        def scan(paths=None):
+            planner.run(lambda entry, rules: seen.append(entry.path) or False, paths=paths)
+
+        scan()
+        path = plant(os.path.join(self.root, "yeni", "alt"), "recent.json")
+        now[0] += 1.0
+        # Kök özyinelemeli döner; sonradan oluşan alt dizin de okunur
+        scan(watcher.wait())
+        self.assertEqual(seen, [path])
+
+
+if __name__ == "__main__":
+    unittest.main()